@@ -232,12 +232,8 @@ def find_tests_by_executor(suites):
     parameter. Returns a dict keyed by test name, value is array of suite names.
     """
 
-    memberships = {}
     test_membership = resmokelib.suitesconfig.create_test_membership_map()
-    for suite in suites:
-        for test in suite.tests:
-            memberships[test] = test_membership[test]
-    return memberships
+    return {test: test_membership[test] for suite in suites for test in suite.tests}
 
 
 def create_executor_list(suites, exclude_suites):
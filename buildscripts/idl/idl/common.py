@@ -35,12 +35,15 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import os
 import string
-from typing import Mapping
+from typing import Dict, Mapping
 
 COMMAND_NAMESPACE_CONCATENATE_WITH_DB = "concatenate_with_db"
 COMMAND_NAMESPACE_IGNORED = "ignored"
 COMMAND_NAMESPACE_TYPE = "type"
 
+# Cache of escaped string.Template objects, keyed by the original template text
+_TEMPLATE_CACHE = {}  # type: Dict[unicode, string.Template]
+
 
 def title_case(name):
     # type: (unicode) -> unicode
@@ -78,14 +81,26 @@ def _escape_template_string(template):
     return template.replace('#{', '${')
 
 
+def _get_template(template):
+    # type: (unicode) -> string.Template
+    """Return the escaped string.Template for a template string, reusing a cached one if present."""
+    # The generator writes the same template strings for every struct, field, and command, so
+    # only escape and construct each template once per process.
+    compiled_template = _TEMPLATE_CACHE.get(template)
+    if compiled_template is None:
+        compiled_template = string.Template(_escape_template_string(template))
+        _TEMPLATE_CACHE[template] = compiled_template
+
+    return compiled_template
+
+
 def template_format(template, template_params=None):
     # type: (unicode, Mapping[unicode,unicode]) -> unicode
     """Write a template to the stream."""
     # Ignore the types since we use unicode literals and this expects str but works fine with
     # unicode.
     # See https://docs.python.org/2/library/string.html#template-strings
-    template = _escape_template_string(template)
-    return string.Template(template).substitute(template_params)  # type: ignore
+    return _get_template(template).substitute(template_params)  # type: ignore
 
 
 def template_args(template, **kwargs):
@@ -94,13 +109,14 @@ def template_args(template, **kwargs):
     # Ignore the types since we use unicode literals and this expects str but works fine with
     # unicode.
     # See https://docs.python.org/2/library/string.html#template-strings
-    template = _escape_template_string(template)
-    return string.Template(template).substitute(kwargs)  # type: ignore
+    return _get_template(template).substitute(kwargs)  # type: ignore
 
 
 class SourceLocation(object):
     """Source location information about an idl.syntax or idl.AST object."""
 
+    __slots__ = ('file_name', 'line', 'column')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct a source location."""
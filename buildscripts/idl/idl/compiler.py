@@ -33,11 +33,17 @@ Orchestrates the 3 passes (parser, binder, and generator) together.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import copy
+import errno
+import glob
+import hashlib
 import io
 import logging
 import os
 import platform
-from typing import Any, List
+import shutil
+import tempfile
+from typing import Any, Dict, List, Optional
 
 from . import binder
 from . import errors
@@ -45,6 +51,9 @@ from . import generator
 from . import parser
 from . import syntax
 
+# Hash of the IDL compiler's own source files, computed on first use
+_COMPILER_SOURCE_HASH = None  # type: Optional[str]
+
 
 class CompilerArgs(object):
     """Set of compiler arguments."""
@@ -65,6 +74,9 @@ class CompilerArgs(object):
 
         self.write_dependencies = False  # type: bool
 
+        # Optional directory used to cache generated files across compiler invocations
+        self.cache_dir = os.environ.get("MONGO_IDL_CACHE_DIR")  # type: Optional[unicode]
+
 
 class CompilerImportResolver(parser.ImportResolverBase):
     """Class for the IDL compiler to resolve imported files."""
@@ -171,13 +183,150 @@ def _update_import_includes(args, spec, header_file_name):
         spec.globals.cpp_includes.append(include_h_file_name)
 
 
+def _get_compiler_source_hash():
+    # type: () -> str
+    """Return a hash of the IDL compiler's own source files."""
+    global _COMPILER_SOURCE_HASH  # pylint: disable=global-statement
+    if _COMPILER_SOURCE_HASH is None:
+        hasher = hashlib.sha256()
+        for source_file_name in sorted(glob.glob(os.path.join(os.path.dirname(__file__), "*.py"))):
+            with io.open(source_file_name, 'rb') as source_stream:
+                hasher.update(source_stream.read())
+
+        _COMPILER_SOURCE_HASH = hasher.hexdigest()
+
+    return _COMPILER_SOURCE_HASH
+
+
+def _get_cache_key(args, input_bytes, spec, header_file_name, source_file_name):
+    # type: (CompilerArgs, bytes, syntax.IDLSpec, unicode, unicode) -> unicode
+    """Compute the generated file cache key for an IDL file, its imports, and the compiler args."""
+    hasher = hashlib.sha256()
+    hasher.update(input_bytes)
+
+    # The resolved import paths determine the include paths generated for imported files
+    for input_file_name in sorted(spec.imports.dependencies if spec.imports else []):
+        hasher.update(("%s\0" % (input_file_name)).encode('utf-8'))
+        with io.open(input_file_name, 'rb') as input_stream:
+            hasher.update(input_stream.read())
+
+    hasher.update(_get_compiler_source_hash())
+
+    # The generated code embeds include paths and architecture specific code, and the output suffix
+    # names the headers included for imported files
+    for arg in [
+            args.target_arch, args.output_base_dir, args.output_suffix, header_file_name,
+            source_file_name
+    ]:
+        hasher.update(("%s\0" % (arg)).encode('utf-8'))
+
+    return hasher.hexdigest()
+
+
+def _restore_from_cache(cache_entry_dir, header_file_name, source_file_name):
+    # type: (unicode, unicode, unicode) -> bool
+    """Copy cached generated files to their output locations, return False on a cache miss."""
+    cached_file_names = [
+        os.path.join(cache_entry_dir, os.path.basename(file_name))
+        for file_name in [header_file_name, source_file_name]
+    ]
+    if not all(os.path.exists(file_name) for file_name in cached_file_names):
+        return False
+
+    logging.debug("Using cached generated files from '%s'", cache_entry_dir)
+    shutil.copyfile(cached_file_names[0], header_file_name)
+    shutil.copyfile(cached_file_names[1], source_file_name)
+    return True
+
+
+def _make_cache_dir(cache_dir):
+    # type: (unicode) -> None
+    """Create the cache directory unless it already exists."""
+    try:
+        os.makedirs(cache_dir)
+    except OSError as err:
+        # Concurrent compilers sharing a new cache directory may race to create it
+        if err.errno != errno.EEXIST or not os.path.isdir(cache_dir):
+            raise
+
+
+def _save_to_cache(cache_dir, cache_entry_dir, header_file_name, source_file_name):
+    # type: (unicode, unicode, unicode, unicode) -> None
+    """Copy generated files into the cache, logging any error instead of failing the compile."""
+    temp_dir = None
+    try:
+        _make_cache_dir(cache_dir)
+
+        # Populate a temporary directory and rename it so concurrent compilers never see a
+        # partially written cache entry.
+        temp_dir = tempfile.mkdtemp(dir=cache_dir)
+        for file_name in [header_file_name, source_file_name]:
+            shutil.copyfile(file_name, os.path.join(temp_dir, os.path.basename(file_name)))
+
+        os.rename(temp_dir, cache_entry_dir)
+    except (IOError, OSError) as err:
+        # Another compiler may have populated the same cache entry first
+        if not os.path.isdir(cache_entry_dir):
+            logging.warning("Could not save generated files to the cache directory '%s': %s",
+                            cache_dir, err)
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 def compile_idl(args):
     # type: (CompilerArgs) -> bool
     """Compile an IDL file into C++ code."""
     # Named compile_idl to avoid naming conflict with builtin
-    if not os.path.exists(args.input_file):
-        logging.error("File '%s' not found", args.input_file)
+    input_bytes = _read_input_file(args.input_file)
+    if input_bytes is None:
+        return False
+
+    return _compile_idl(args, input_bytes, None)
+
+
+def compile_idl_batch(args, input_files):
+    # type: (CompilerArgs, List[unicode]) -> bool
+    """
+    Compile a list of IDL files into C++ code.
+
+    Files imported by several of the IDL files are only read and composed as YAML once, though
+    their YAML documents are still parsed into idl.syntax trees for every file importing them.
+    Output file names are derived from each input file name and args.output_suffix.
+    """
+    if args.output_source is not None or args.output_header is not None:
+        raise ValueError("compile_idl_batch derives output file names from each input file name")
+
+    node_cache = {}  # type: Dict[unicode, Any]
+    success = True
+    for input_file in input_files:
+        file_args = copy.copy(args)
+        file_args.input_file = input_file
+
+        input_bytes = _read_input_file(input_file)
+        if input_bytes is None:
+            success = False
+            continue
+
+        success = _compile_idl(file_args, input_bytes, node_cache) and success
 
+    return success
+
+
+def _read_input_file(input_file):
+    # type: (unicode) -> Optional[bytes]
+    """Read the contents of an IDL file, or return None if it cannot be read."""
+    try:
+        with io.open(input_file, 'rb') as file_stream:
+            return file_stream.read()
+    except IOError as err:
+        logging.error("Could not read file '%s': %s", input_file, err.strerror)
+        return None
+
+
+def _compile_idl(args, input_bytes, node_cache):
+    # type: (CompilerArgs, bytes, Optional[Dict[unicode, Any]]) -> bool
+    """Compile an IDL file into C++ code, sharing composed YAML documents through node_cache."""
+    # pylint: disable=too-many-branches
     if args.output_source is None:
         if not '.' in args.input_file:
             logging.error("File name '%s' must be end with a filename extension, such as '%s.idl'",
@@ -197,27 +346,37 @@ def compile_idl(args):
         args.target_arch = platform.machine()
 
     # Compile the IDL through the 3 passes
-    with io.open(args.input_file, encoding='utf-8') as file_stream:
-        parsed_doc = parser.parse(file_stream, args.input_file,
-                                  CompilerImportResolver(args.import_directories))
-
-        if not parsed_doc.errors:
-            # Stop compiling if we only need to scan import dependencies
-            if args.write_dependencies:
-                _write_dependencies(parsed_doc.spec)
+    resolver = CompilerImportResolver(args.import_directories)
+    parsed_doc = parser.parse(input_bytes.decode('utf-8'), args.input_file, resolver, node_cache)
+
+    if not parsed_doc.errors:
+        # Stop compiling if we only need to scan import dependencies
+        if args.write_dependencies:
+            _write_dependencies(parsed_doc.spec)
+            return True
+
+        _update_import_includes(args, parsed_doc.spec, header_file_name)
+
+        cache_entry_dir = None
+        if args.cache_dir:
+            cache_key = _get_cache_key(args, input_bytes, parsed_doc.spec, header_file_name,
+                                       source_file_name)
+            cache_entry_dir = os.path.join(args.cache_dir, cache_key)
+            if _restore_from_cache(cache_entry_dir, header_file_name, source_file_name):
                 return True
 
-            _update_import_includes(args, parsed_doc.spec, header_file_name)
+        bound_doc = binder.bind(parsed_doc.spec)
+        if not bound_doc.errors:
+            generator.generate_code(bound_doc.spec, args.target_arch, args.output_base_dir,
+                                    header_file_name, source_file_name)
 
-            bound_doc = binder.bind(parsed_doc.spec)
-            if not bound_doc.errors:
-                generator.generate_code(bound_doc.spec, args.target_arch, args.output_base_dir,
-                                        header_file_name, source_file_name)
+            if cache_entry_dir:
+                _save_to_cache(args.cache_dir, cache_entry_dir, header_file_name, source_file_name)
 
-                return True
-            else:
-                bound_doc.errors.dump_errors()
+            return True
         else:
-            parsed_doc.errors.dump_errors()
+            bound_doc.errors.dump_errors()
+    else:
+        parsed_doc.errors.dump_errors()
 
-        return False
+    return False
@@ -37,7 +37,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 import inspect
 import os
 import sys
-from typing import List, Union, Any
+from typing import Any, Dict, Iterator, List, Union
 from yaml import nodes
 import yaml
 
@@ -112,6 +112,9 @@ ERROR_ID_SERVER_PARAMETER_INVALID_ATTR = "ID0066"
 ERROR_ID_SERVER_PARAMETER_REQUIRED_ATTR = "ID0067"
 ERROR_ID_SERVER_PARAMETER_INVALID_METHOD_OVERRIDE = "ID0068"
 
+# Map of the accepted YAML bool scalar values to their bool value
+_BOOL_VALUES = {"true": True, "false": False}  # type: Dict[unicode, bool]
+
 
 class IDLError(Exception):
     """Base class for all IDL exceptions."""
@@ -131,6 +134,8 @@ class ParserError(common.SourceLocation):
     - column - the column number of the error or near enough.
     """
 
+    __slots__ = ('error_id', 'msg')
+
     def __init__(self, error_id, msg, file_name, line, column):
         # type: (unicode, unicode, unicode, int, int) -> None
         """Construct a parser error with source location information."""
@@ -162,8 +167,13 @@ class ParserErrorCollection(object):
     def add(self, location, error_id, msg):
         # type: (common.SourceLocation, unicode, unicode) -> None
         """Add an error message with file (line, column) information."""
-        self._errors.append(
-            ParserError(error_id, msg, location.file_name, location.line, location.column))
+        self.add_at(location.file_name, location.line, location.column, error_id, msg)
+
+    def add_at(self, file_name, line, column, error_id, msg):
+        # type: (unicode, int, int, unicode, unicode) -> None
+        """Add an error message at an explicit file (line, column) position."""
+        # pylint: disable=too-many-arguments
+        self._errors.append(ParserError(error_id, msg, file_name, line, column))
 
     def has_errors(self):
         # type: () -> bool
@@ -173,20 +183,25 @@ class ParserErrorCollection(object):
     def contains(self, error_id):
         # type: (unicode) -> bool
         """Check if the error collection has at least one message of a given error_id."""
-        return len([a for a in self._errors if a.error_id == error_id]) > 0
+        return any(error.error_id == error_id for error in self._errors)
+
+    def __iter__(self):
+        # type: () -> Iterator[unicode]
+        """Return an iterator over the formatted error messages."""
+        return (str(error) for error in self._errors)
 
     def to_list(self):
         # type: () -> List[unicode]
         """Return a list of formatted error messages."""
-        return [str(error) for error in self._errors]
+        return list(self)
 
     def dump_errors(self):
         # type: () -> None
         """Print the list of errors."""
         print("Errors found while compiling IDL")
-        for error_msg in self.to_list():
+        for error_msg in self:
             print("%s\n\n" % error_msg)
-        print("Found %s errors" % (len(self.to_list())))
+        print("Found %s errors" % (self.count()))
 
     def count(self):
         # type: () -> int
@@ -196,7 +211,7 @@ class ParserErrorCollection(object):
     def __str__(self):
         # type: () -> str
         """Return a list of errors."""
-        return ', '.join(self.to_list())  # type: ignore
+        return ', '.join(self)  # type: ignore
 
 
 class ParserContext(object):
@@ -228,9 +243,8 @@ class ParserContext(object):
     def _add_node_error(self, node, error_id, msg):
         # type: (yaml.nodes.Node, unicode, unicode) -> None
         """Add an error with source location information based on a YAML node."""
-        self.errors.add(
-            common.SourceLocation(self.file_name, node.start_mark.line, node.start_mark.column),
-            error_id, msg)
+        mark = node.start_mark
+        self.errors.add_at(self.file_name, mark.line, mark.column, error_id, msg)
 
     def add_unknown_root_node_error(self, node):
         # type: (yaml.nodes.Node) -> None
@@ -325,7 +339,7 @@ class ParserContext(object):
         if not self._is_node_type(node, node_name, "scalar"):
             return False
 
-        if not (node.value == "true" or node.value == "false"):
+        if node.value not in _BOOL_VALUES:
             self._add_node_error(
                 node, ERROR_ID_IS_NODE_VALID_BOOL,
                 "Illegal bool value for '%s', expected either 'true' or 'false'." % node_name)
@@ -335,12 +349,9 @@ class ParserContext(object):
 
     def get_bool(self, node):
         # type: (Union[yaml.nodes.MappingNode, yaml.nodes.ScalarNode, yaml.nodes.SequenceNode]) -> bool
-        """Convert a scalar to a bool."""
-        assert self.is_scalar_bool_node(node, "unknown")
-
-        if node.value == "true":
-            return True
-        return False
+        """Convert a scalar already checked by is_scalar_bool_node to a bool."""
+        # pylint: disable=no-self-use
+        return _BOOL_VALUES[node.value]
 
     def get_list(self, node):
         # type: (Union[yaml.nodes.MappingNode, yaml.nodes.ScalarNode, yaml.nodes.SequenceNode]) -> List[unicode]
@@ -671,6 +682,10 @@ class ParserContext(object):
         if not self._is_node_type(node, node_name, "scalar"):
             return False
 
+        # Plain digit strings are always valid, only fall back to int() to diagnose other values
+        if node.value.isdecimal():
+            return True
+
         try:
             value = int(node.value)
             if value < 0:
@@ -690,9 +705,8 @@ class ParserContext(object):
 
     def get_non_negative_int(self, node):
         # type: (Union[yaml.nodes.MappingNode, yaml.nodes.ScalarNode, yaml.nodes.SequenceNode]) -> int
-        """Convert a scalar to an int."""
-        assert self.is_scalar_non_negative_int_node(node, "unknown")
-
+        """Convert a scalar already checked by is_scalar_non_negative_int_node to an int."""
+        # pylint: disable=no-self-use
         return int(node.value)
 
     def add_duplicate_comparison_order_field_error(self, location, struct_name, comparison_order):
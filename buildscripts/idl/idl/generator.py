@@ -591,24 +591,35 @@ class _CppHeaderFileWriter(_CppFileWriterBase):
         if cpp_type_info.return_by_reference():
             param_type += "&"
 
+        method_name = _get_field_member_getter_name(field)
+        const_type = 'const ' if cpp_type_info.is_const_type() else ''
+
+        # Getters of chained struct fields forward to the chained struct, so they need no body.
+        if field.chained_struct_field:
+            template_params = {
+                'method_name': method_name,
+                'param_type': param_type,
+                'const_type': const_type,
+            }
+
+            with self._with_template(template_params):
+                self._writer.write_template(
+                    '${const_type} ${param_type} ${method_name}() const { return %s.%s(); }' %
+                    ((_get_field_member_name(field.chained_struct_field), method_name)))
+            return
+
         template_params = {
-            'method_name': _get_field_member_getter_name(field),
+            'method_name': method_name,
             'param_type': param_type,
             'body': cpp_type_info.get_getter_body(member_name),
-            'const_type': 'const ' if cpp_type_info.is_const_type() else '',
+            'const_type': const_type,
         }
 
         # Generate a getter that disables xvalue for view types (i.e. StringData), constructed
         # optional types, and non-primitive types.
         with self._with_template(template_params):
 
-            if field.chained_struct_field:
-                self._writer.write_template(
-                    '${const_type} ${param_type} ${method_name}() const { return %s.%s(); }' %
-                    ((_get_field_member_name(field.chained_struct_field),
-                      _get_field_member_getter_name(field))))
-
-            elif cpp_type_info.disable_xvalue():
+            if cpp_type_info.disable_xvalue():
                 self._writer.write_template(
                     'const ${param_type} ${method_name}() const& { ${body} }')
                 self._writer.write_template('void ${method_name}() && = delete;')
@@ -34,8 +34,10 @@ Only validates the document is syntatically correct, not semantically.
 from __future__ import absolute_import, print_function, unicode_literals
 
 from abc import ABCMeta, abstractmethod
+import functools
 import io
-from typing import Any, Callable, Dict, List, Set, Tuple, Union
+import os
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 import yaml
 from yaml import nodes
 
@@ -44,6 +46,54 @@ from . import cpp_types
 from . import errors
 from . import syntax
 
+# Compose documents with the libyaml based loader when it is available since it is much faster than
+# the pure Python loader.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
+
+
+def _get_scalar_value(ctxt, rule_desc, node):
+    # type: (errors.ParserContext, _RuleDesc, yaml.nodes.ScalarNode) -> unicode
+    # pylint: disable=unused-argument
+    return node.value
+
+
+def _get_bool_value(ctxt, rule_desc, node):
+    # type: (errors.ParserContext, _RuleDesc, yaml.nodes.ScalarNode) -> bool
+    # pylint: disable=unused-argument
+    return ctxt.get_bool(node)
+
+
+def _get_int_value(ctxt, rule_desc, node):
+    # type: (errors.ParserContext, _RuleDesc, yaml.nodes.ScalarNode) -> int
+    # pylint: disable=unused-argument
+    return ctxt.get_non_negative_int(node)
+
+
+def _get_list_value(ctxt, rule_desc, node):
+    # type: (errors.ParserContext, _RuleDesc, Union[yaml.nodes.ScalarNode, yaml.nodes.SequenceNode]) -> List[unicode]
+    # pylint: disable=unused-argument
+    return ctxt.get_list(node)
+
+
+def _get_mapping_value(ctxt, rule_desc, node):
+    # type: (errors.ParserContext, _RuleDesc, Union[yaml.nodes.ScalarNode, yaml.nodes.MappingNode]) -> Any
+    return rule_desc.mapping_parser_func(ctxt, node)
+
+
+# Map of _RuleDesc node_type to a pair of (node validation function, node value function)
+_NODE_TYPE_HANDLERS = {
+    "scalar": (errors.ParserContext.is_scalar_node, _get_scalar_value),
+    "bool_scalar": (errors.ParserContext.is_scalar_bool_node, _get_bool_value),
+    "int_scalar": (errors.ParserContext.is_scalar_non_negative_int_node, _get_int_value),
+    "scalar_or_sequence": (errors.ParserContext.is_scalar_sequence_or_scalar_node, _get_list_value),
+    "sequence": (errors.ParserContext.is_scalar_sequence, _get_list_value),
+    "scalar_or_mapping": (errors.ParserContext.is_scalar_or_mapping_node, _get_mapping_value),
+    "mapping": (errors.ParserContext.is_mapping_node, _get_mapping_value),
+}  # type: Dict[unicode, Tuple[Callable[..., bool], Callable[..., Any]]]
+
 
 class _RuleDesc(object):
     """
@@ -68,9 +118,13 @@ class _RuleDesc(object):
         """Construct a parser rule description."""
         assert required == _RuleDesc.REQUIRED or required == _RuleDesc.OPTIONAL
 
+        if node_type not in _NODE_TYPE_HANDLERS:
+            raise errors.IDLError("Unknown node_type '%s' for parser rule" % (node_type))
+
         self.node_type = node_type  # type: unicode
         self.required = required  # type: int
         self.mapping_parser_func = mapping_parser_func  # type: Callable[[errors.ParserContext,yaml.nodes.MappingNode], Any]
+        self.is_valid_func, self.get_value_func = _NODE_TYPE_HANDLERS[node_type]
 
 
 def _generic_parser(
@@ -80,7 +134,6 @@ def _generic_parser(
         syntax_node,  # type: Any
         mapping_rules  # type: Dict[unicode, _RuleDesc]
 ):  # type: (...) -> None
-    # pylint: disable=too-many-branches
     field_name_set = set()  # type: Set[str]
 
     for [first_node, second_node] in node.value:
@@ -91,35 +144,11 @@ def _generic_parser(
             ctxt.add_duplicate_error(first_node, first_name)
             continue
 
-        if first_name in mapping_rules:
-            rule_desc = mapping_rules[first_name]
-
-            if rule_desc.node_type == "scalar":
-                if ctxt.is_scalar_node(second_node, first_name):
-                    syntax_node.__dict__[first_name] = second_node.value
-            elif rule_desc.node_type == "bool_scalar":
-                if ctxt.is_scalar_bool_node(second_node, first_name):
-                    syntax_node.__dict__[first_name] = ctxt.get_bool(second_node)
-            elif rule_desc.node_type == "int_scalar":
-                if ctxt.is_scalar_non_negative_int_node(second_node, first_name):
-                    syntax_node.__dict__[first_name] = ctxt.get_non_negative_int(second_node)
-            elif rule_desc.node_type == "scalar_or_sequence":
-                if ctxt.is_scalar_sequence_or_scalar_node(second_node, first_name):
-                    syntax_node.__dict__[first_name] = ctxt.get_list(second_node)
-            elif rule_desc.node_type == "sequence":
-                if ctxt.is_scalar_sequence(second_node, first_name):
-                    syntax_node.__dict__[first_name] = ctxt.get_list(second_node)
-            elif rule_desc.node_type == "scalar_or_mapping":
-                if ctxt.is_scalar_or_mapping_node(second_node, first_name):
-                    syntax_node.__dict__[first_name] = rule_desc.mapping_parser_func(
-                        ctxt, second_node)
-            elif rule_desc.node_type == "mapping":
-                if ctxt.is_mapping_node(second_node, first_name):
-                    syntax_node.__dict__[first_name] = rule_desc.mapping_parser_func(
-                        ctxt, second_node)
-            else:
-                raise errors.IDLError("Unknown node_type '%s' for parser rule" %
-                                      (rule_desc.node_type))
+        rule_desc = mapping_rules.get(first_name)
+        if rule_desc is not None:
+            if rule_desc.is_valid_func(ctxt, second_node, first_name):
+                setattr(syntax_node, first_name,
+                        rule_desc.get_value_func(ctxt, rule_desc, second_node))
         else:
             ctxt.add_unknown_node_error(first_node, syntax_node_name)
 
@@ -134,7 +163,7 @@ def _generic_parser(
         # It means "if bool is None" will always return false and there is no support for required
         # 'bool' at this time.
         if not rule_desc.node_type == 'bool_scalar':
-            if syntax_node.__dict__[name] is None:
+            if getattr(syntax_node, name) is None:
                 ctxt.add_missing_required_field_error(node, syntax_node_name, name)
         else:
             raise errors.IDLError("Unknown node_type '%s' for parser required rule" %
@@ -159,21 +188,30 @@ def _parse_mapping(
         func(ctxt, spec, first_name, second_node)
 
 
+_CONFIG_GLOBAL_RULES = {
+    "section": _RuleDesc("scalar"),
+    "source": _RuleDesc("scalar_or_sequence"),
+    "initializer_name": _RuleDesc("scalar"),
+}  # type: Dict[unicode, _RuleDesc]
+
+
 def _parse_config_global(ctxt, node):
     # type: (errors.ParserContext, yaml.nodes.MappingNode) -> syntax.ConfigGlobal
     """Parse global settings for config options."""
     config = syntax.ConfigGlobal(ctxt.file_name, node.start_mark.line, node.start_mark.column)
 
-    _generic_parser(
-        ctxt, node, "configs", config, {
-            "section": _RuleDesc("scalar"),
-            "source": _RuleDesc("scalar_or_sequence"),
-            "initializer_name": _RuleDesc("scalar"),
-        })
+    _generic_parser(ctxt, node, "configs", config, _CONFIG_GLOBAL_RULES)
 
     return config
 
 
+_GLOBAL_RULES = {
+    "cpp_namespace": _RuleDesc("scalar"),
+    "cpp_includes": _RuleDesc("scalar_or_sequence"),
+    "configs": _RuleDesc("mapping", mapping_parser_func=_parse_config_global),
+}  # type: Dict[unicode, _RuleDesc]
+
+
 def _parse_global(ctxt, spec, node):
     # type: (errors.ParserContext, syntax.IDLSpec, Union[yaml.nodes.MappingNode, yaml.nodes.ScalarNode, yaml.nodes.SequenceNode]) -> None
     """Parse a global section in the IDL file."""
@@ -182,11 +220,7 @@ def _parse_global(ctxt, spec, node):
 
     idlglobal = syntax.Global(ctxt.file_name, node.start_mark.line, node.start_mark.column)
 
-    _generic_parser(
-        ctxt, node, "global", idlglobal, {
-            "cpp_namespace": _RuleDesc("scalar"), "cpp_includes": _RuleDesc("scalar_or_sequence"),
-            "configs": _RuleDesc("mapping", mapping_parser_func=_parse_config_global)
-        })
+    _generic_parser(ctxt, node, "global", idlglobal, _GLOBAL_RULES)
 
     spec.globals = idlglobal
 
@@ -202,6 +236,17 @@ def _parse_imports(ctxt, spec, node):
     spec.imports = imports
 
 
+_TYPE_RULES = {
+    "description": _RuleDesc('scalar', _RuleDesc.REQUIRED),
+    "cpp_type": _RuleDesc('scalar', _RuleDesc.REQUIRED),
+    "bson_serialization_type": _RuleDesc('scalar_or_sequence', _RuleDesc.REQUIRED),
+    "bindata_subtype": _RuleDesc('scalar'),
+    "serializer": _RuleDesc('scalar'),
+    "deserializer": _RuleDesc('scalar'),
+    "default": _RuleDesc('scalar'),
+}  # type: Dict[unicode, _RuleDesc]
+
+
 def _parse_type(ctxt, spec, name, node):
     # type: (errors.ParserContext, syntax.IDLSpec, unicode, Union[yaml.nodes.MappingNode, yaml.nodes.ScalarNode, yaml.nodes.SequenceNode]) -> None
     """Parse a type section in the IDL file."""
@@ -211,20 +256,17 @@ def _parse_type(ctxt, spec, name, node):
     idltype = syntax.Type(ctxt.file_name, node.start_mark.line, node.start_mark.column)
     idltype.name = name
 
-    _generic_parser(
-        ctxt, node, "type", idltype, {
-            "description": _RuleDesc('scalar', _RuleDesc.REQUIRED),
-            "cpp_type": _RuleDesc('scalar', _RuleDesc.REQUIRED),
-            "bson_serialization_type": _RuleDesc('scalar_or_sequence', _RuleDesc.REQUIRED),
-            "bindata_subtype": _RuleDesc('scalar'),
-            "serializer": _RuleDesc('scalar'),
-            "deserializer": _RuleDesc('scalar'),
-            "default": _RuleDesc('scalar'),
-        })
+    _generic_parser(ctxt, node, "type", idltype, _TYPE_RULES)
 
     spec.symbols.add_type(ctxt, idltype)
 
 
+_EXPRESSION_RULES = {
+    "expr": _RuleDesc('scalar', _RuleDesc.REQUIRED),
+    "is_constexpr": _RuleDesc('bool_scalar'),
+}  # type: Dict[unicode, _RuleDesc]
+
+
 def _parse_expression(ctxt, node):
     # type: (errors.ParserContext, Union[yaml.nodes.ScalarNode,yaml.nodes.MappingNode]) -> syntax.Expression
     """Parse an expression as either a scalar or a mapping."""
@@ -234,64 +276,67 @@ def _parse_expression(ctxt, node):
         expr.literal = node.value
         return expr
 
-    _generic_parser(ctxt, node, "expr", expr, {
-        "expr": _RuleDesc('scalar', _RuleDesc.REQUIRED),
-        "is_constexpr": _RuleDesc('bool_scalar'),
-    })
+    _generic_parser(ctxt, node, "expr", expr, _EXPRESSION_RULES)
 
     return expr
 
 
+_VALIDATOR_RULES = {
+    "gt": _RuleDesc("scalar_or_mapping", mapping_parser_func=_parse_expression),
+    "lt": _RuleDesc("scalar_or_mapping", mapping_parser_func=_parse_expression),
+    "gte": _RuleDesc("scalar_or_mapping", mapping_parser_func=_parse_expression),
+    "lte": _RuleDesc("scalar_or_mapping", mapping_parser_func=_parse_expression),
+    "callback": _RuleDesc("scalar"),
+}  # type: Dict[unicode, _RuleDesc]
+
+
 def _parse_validator(ctxt, node):
     # type: (errors.ParserContext, yaml.nodes.MappingNode) -> syntax.Validator
     """Parse a validator for a field."""
     validator = syntax.Validator(ctxt.file_name, node.start_mark.line, node.start_mark.column)
 
-    _generic_parser(
-        ctxt, node, "validator", validator, {
-            "gt": _RuleDesc("scalar_or_mapping", mapping_parser_func=_parse_expression),
-            "lt": _RuleDesc("scalar_or_mapping", mapping_parser_func=_parse_expression),
-            "gte": _RuleDesc("scalar_or_mapping", mapping_parser_func=_parse_expression),
-            "lte": _RuleDesc("scalar_or_mapping", mapping_parser_func=_parse_expression),
-            "callback": _RuleDesc("scalar"),
-        })
+    _generic_parser(ctxt, node, "validator", validator, _VALIDATOR_RULES)
 
     return validator
 
 
+_CONDITION_RULES = {
+    "preprocessor": _RuleDesc("scalar"),
+    "constexpr": _RuleDesc("scalar"),
+    "expr": _RuleDesc("scalar"),
+}  # type: Dict[unicode, _RuleDesc]
+
+
 def _parse_condition(ctxt, node):
     # type: (errors.ParserContext, yaml.nodes.MappingNode) -> syntax.Condition
     """Parse a condition."""
     condition = syntax.Condition(ctxt.file_name, node.start_mark.line, node.start_mark.column)
 
-    _generic_parser(
-        ctxt, node, "condition", condition, {
-            "preprocessor": _RuleDesc("scalar"),
-            "constexpr": _RuleDesc("scalar"),
-            "expr": _RuleDesc("scalar"),
-        })
+    _generic_parser(ctxt, node, "condition", condition, _CONDITION_RULES)
 
     return condition
 
 
+_FIELD_RULES = {
+    "description": _RuleDesc('scalar'),
+    "cpp_name": _RuleDesc('scalar'),
+    "type": _RuleDesc('scalar', _RuleDesc.REQUIRED),
+    "ignore": _RuleDesc("bool_scalar"),
+    "optional": _RuleDesc("bool_scalar"),
+    "default": _RuleDesc('scalar'),
+    "supports_doc_sequence": _RuleDesc("bool_scalar"),
+    "comparison_order": _RuleDesc("int_scalar"),
+    "validator": _RuleDesc('mapping', mapping_parser_func=_parse_validator),
+}  # type: Dict[unicode, _RuleDesc]
+
+
 def _parse_field(ctxt, name, node):
     # type: (errors.ParserContext, str, Union[yaml.nodes.MappingNode, yaml.nodes.ScalarNode, yaml.nodes.SequenceNode]) -> syntax.Field
     """Parse a field in a struct/command in the IDL file."""
     field = syntax.Field(ctxt.file_name, node.start_mark.line, node.start_mark.column)
     field.name = name
 
-    _generic_parser(
-        ctxt, node, "field", field, {
-            "description": _RuleDesc('scalar'),
-            "cpp_name": _RuleDesc('scalar'),
-            "type": _RuleDesc('scalar', _RuleDesc.REQUIRED),
-            "ignore": _RuleDesc("bool_scalar"),
-            "optional": _RuleDesc("bool_scalar"),
-            "default": _RuleDesc('scalar'),
-            "supports_doc_sequence": _RuleDesc("bool_scalar"),
-            "comparison_order": _RuleDesc("int_scalar"),
-            "validator": _RuleDesc('mapping', mapping_parser_func=_parse_validator),
-        })
+    _generic_parser(ctxt, node, "field", field, _FIELD_RULES)
 
     return field
 
@@ -327,15 +372,18 @@ def _parse_fields(ctxt, node):
     return fields
 
 
+_CHAINED_TYPE_RULES = {
+    "cpp_name": _RuleDesc('scalar'),
+}  # type: Dict[unicode, _RuleDesc]
+
+
 def _parse_chained_type(ctxt, name, node):
     # type: (errors.ParserContext, str, yaml.nodes.MappingNode) -> syntax.ChainedType
     """Parse a chained type in a struct in the IDL file."""
     chain = syntax.ChainedType(ctxt.file_name, node.start_mark.line, node.start_mark.column)
     chain.name = name
 
-    _generic_parser(ctxt, node, "chain", chain, {
-        "cpp_name": _RuleDesc('scalar'),
-    })
+    _generic_parser(ctxt, node, "chain", chain, _CHAINED_TYPE_RULES)
 
     return chain
 
@@ -369,15 +417,18 @@ def _parse_chained_types(ctxt, node):
     return chained_items
 
 
+_CHAINED_STRUCT_RULES = {
+    "cpp_name": _RuleDesc('scalar'),
+}  # type: Dict[unicode, _RuleDesc]
+
+
 def _parse_chained_struct(ctxt, name, node):
     # type: (errors.ParserContext, str, yaml.nodes.MappingNode) -> syntax.ChainedStruct
     """Parse a chained struct in a struct in the IDL file."""
     chain = syntax.ChainedStruct(ctxt.file_name, node.start_mark.line, node.start_mark.column)
     chain.name = name
 
-    _generic_parser(ctxt, node, "chain", chain, {
-        "cpp_name": _RuleDesc('scalar'),
-    })
+    _generic_parser(ctxt, node, "chain", chain, _CHAINED_STRUCT_RULES)
 
     return chain
 
@@ -413,6 +464,18 @@ def _parse_chained_structs(ctxt, node):
     return chained_items
 
 
+_STRUCT_RULES = {
+    "description": _RuleDesc('scalar', _RuleDesc.REQUIRED),
+    "fields": _RuleDesc('mapping', mapping_parser_func=_parse_fields),
+    "chained_types": _RuleDesc('mapping', mapping_parser_func=_parse_chained_types),
+    "chained_structs": _RuleDesc('mapping', mapping_parser_func=_parse_chained_structs),
+    "strict": _RuleDesc("bool_scalar"),
+    "inline_chained_structs": _RuleDesc("bool_scalar"),
+    "immutable": _RuleDesc('bool_scalar'),
+    "generate_comparison_operators": _RuleDesc("bool_scalar"),
+}  # type: Dict[unicode, _RuleDesc]
+
+
 def _parse_struct(ctxt, spec, name, node):
     # type: (errors.ParserContext, syntax.IDLSpec, unicode, Union[yaml.nodes.MappingNode, yaml.nodes.ScalarNode, yaml.nodes.SequenceNode]) -> None
     """Parse a struct section in the IDL file."""
@@ -422,17 +485,7 @@ def _parse_struct(ctxt, spec, name, node):
     struct = syntax.Struct(ctxt.file_name, node.start_mark.line, node.start_mark.column)
     struct.name = name
 
-    _generic_parser(
-        ctxt, node, "struct", struct, {
-            "description": _RuleDesc('scalar', _RuleDesc.REQUIRED),
-            "fields": _RuleDesc('mapping', mapping_parser_func=_parse_fields),
-            "chained_types": _RuleDesc('mapping', mapping_parser_func=_parse_chained_types),
-            "chained_structs": _RuleDesc('mapping', mapping_parser_func=_parse_chained_structs),
-            "strict": _RuleDesc("bool_scalar"),
-            "inline_chained_structs": _RuleDesc("bool_scalar"),
-            "immutable": _RuleDesc('bool_scalar'),
-            "generate_comparison_operators": _RuleDesc("bool_scalar"),
-        })
+    _generic_parser(ctxt, node, "struct", struct, _STRUCT_RULES)
 
     # TODO: SHOULD WE ALLOW STRUCTS ONLY WITH CHAINED STUFF and no fields???
     if struct.fields is None and struct.chained_types is None and struct.chained_structs is None:
@@ -470,6 +523,13 @@ def _parse_enum_values(ctxt, node):
     return enum_values
 
 
+_ENUM_RULES = {
+    "description": _RuleDesc('scalar', _RuleDesc.REQUIRED),
+    "type": _RuleDesc('scalar', _RuleDesc.REQUIRED),
+    "values": _RuleDesc('mapping', mapping_parser_func=_parse_enum_values),
+}  # type: Dict[unicode, _RuleDesc]
+
+
 def _parse_enum(ctxt, spec, name, node):
     # type: (errors.ParserContext, syntax.IDLSpec, unicode, Union[yaml.nodes.MappingNode, yaml.nodes.ScalarNode, yaml.nodes.SequenceNode]) -> None
     """Parse an enum section in the IDL file."""
@@ -479,12 +539,7 @@ def _parse_enum(ctxt, spec, name, node):
     idl_enum = syntax.Enum(ctxt.file_name, node.start_mark.line, node.start_mark.column)
     idl_enum.name = name
 
-    _generic_parser(
-        ctxt, node, "enum", idl_enum, {
-            "description": _RuleDesc('scalar', _RuleDesc.REQUIRED),
-            "type": _RuleDesc('scalar', _RuleDesc.REQUIRED),
-            "values": _RuleDesc('mapping', mapping_parser_func=_parse_enum_values),
-        })
+    _generic_parser(ctxt, node, "enum", idl_enum, _ENUM_RULES)
 
     if idl_enum.values is None:
         ctxt.add_empty_enum_error(node, idl_enum.name)
@@ -492,6 +547,27 @@ def _parse_enum(ctxt, spec, name, node):
     spec.symbols.add_enum(ctxt, idl_enum)
 
 
+# TODO: support the first argument as UUID depending on outcome of Catalog Versioning changes.
+_VALID_COMMAND_NAMESPACES = [
+    common.COMMAND_NAMESPACE_CONCATENATE_WITH_DB, common.COMMAND_NAMESPACE_IGNORED,
+    common.COMMAND_NAMESPACE_TYPE
+]
+
+_COMMAND_RULES = {
+    "description": _RuleDesc('scalar', _RuleDesc.REQUIRED),
+    "chained_types": _RuleDesc('mapping', mapping_parser_func=_parse_chained_types),
+    "chained_structs": _RuleDesc('mapping', mapping_parser_func=_parse_chained_structs),
+    "fields": _RuleDesc('mapping', mapping_parser_func=_parse_fields),
+    "namespace": _RuleDesc('scalar', _RuleDesc.REQUIRED),
+    "cpp_name": _RuleDesc('scalar'),
+    "type": _RuleDesc('scalar'),
+    "strict": _RuleDesc("bool_scalar"),
+    "inline_chained_structs": _RuleDesc("bool_scalar"),
+    "immutable": _RuleDesc('bool_scalar'),
+    "generate_comparison_operators": _RuleDesc("bool_scalar"),
+}  # type: Dict[unicode, _RuleDesc]
+
+
 def _parse_command(ctxt, spec, name, node):
     # type: (errors.ParserContext, syntax.IDLSpec, unicode, Union[yaml.nodes.MappingNode, yaml.nodes.ScalarNode, yaml.nodes.SequenceNode]) -> None
     """Parse a command section in the IDL file."""
@@ -501,31 +577,12 @@ def _parse_command(ctxt, spec, name, node):
     command = syntax.Command(ctxt.file_name, node.start_mark.line, node.start_mark.column)
     command.name = name
 
-    _generic_parser(
-        ctxt, node, "command", command, {
-            "description": _RuleDesc('scalar', _RuleDesc.REQUIRED),
-            "chained_types": _RuleDesc('mapping', mapping_parser_func=_parse_chained_types),
-            "chained_structs": _RuleDesc('mapping', mapping_parser_func=_parse_chained_structs),
-            "fields": _RuleDesc('mapping', mapping_parser_func=_parse_fields),
-            "namespace": _RuleDesc('scalar', _RuleDesc.REQUIRED),
-            "cpp_name": _RuleDesc('scalar'),
-            "type": _RuleDesc('scalar'),
-            "strict": _RuleDesc("bool_scalar"),
-            "inline_chained_structs": _RuleDesc("bool_scalar"),
-            "immutable": _RuleDesc('bool_scalar'),
-            "generate_comparison_operators": _RuleDesc("bool_scalar"),
-        })
-
-    # TODO: support the first argument as UUID depending on outcome of Catalog Versioning changes.
-    valid_commands = [
-        common.COMMAND_NAMESPACE_CONCATENATE_WITH_DB, common.COMMAND_NAMESPACE_IGNORED,
-        common.COMMAND_NAMESPACE_TYPE
-    ]
+    _generic_parser(ctxt, node, "command", command, _COMMAND_RULES)
 
     if command.namespace:
-        if command.namespace not in valid_commands:
+        if command.namespace not in _VALID_COMMAND_NAMESPACES:
             ctxt.add_bad_command_namespace_error(command, command.name, command.namespace,
-                                                 valid_commands)
+                                                 _VALID_COMMAND_NAMESPACES)
 
         # type property must be specified for a namespace = type
         if command.namespace == common.COMMAND_NAMESPACE_TYPE and not command.type:
@@ -541,6 +598,14 @@ def _parse_command(ctxt, spec, name, node):
     spec.symbols.add_command(ctxt, command)
 
 
+_SERVER_PARAMETER_CLASS_RULES = {
+    "name": _RuleDesc('scalar', _RuleDesc.REQUIRED),
+    "data": _RuleDesc('scalar'),
+    "override_ctor": _RuleDesc('bool_scalar'),
+    "override_set": _RuleDesc('bool_scalar'),
+}  # type: Dict[unicode, _RuleDesc]
+
+
 def _parse_server_parameter_class(ctxt, node):
     # type: (errors.ParserContext, Union[yaml.nodes.ScalarNode,yaml.nodes.MappingNode]) -> syntax.ServerParameterClass
     """Parse a server_parameter.cpp_class as either a scalar or a mapping."""
@@ -550,17 +615,27 @@ def _parse_server_parameter_class(ctxt, node):
         spc.name = node.value
         return spc
 
-    _generic_parser(
-        ctxt, node, "cpp_class", spc, {
-            "name": _RuleDesc('scalar', _RuleDesc.REQUIRED),
-            "data": _RuleDesc('scalar'),
-            "override_ctor": _RuleDesc('bool_scalar'),
-            "override_set": _RuleDesc('bool_scalar'),
-        })
+    _generic_parser(ctxt, node, "cpp_class", spc, _SERVER_PARAMETER_CLASS_RULES)
 
     return spc
 
 
+_SERVER_PARAMETER_RULES = {
+    "set_at": _RuleDesc('scalar_or_sequence', _RuleDesc.REQUIRED),
+    "description": _RuleDesc('scalar', _RuleDesc.REQUIRED),
+    "cpp_vartype": _RuleDesc('scalar'),
+    "cpp_varname": _RuleDesc('scalar'),
+    "condition": _RuleDesc('mapping', mapping_parser_func=_parse_condition),
+    "redact": _RuleDesc('bool_scalar'),
+    "default": _RuleDesc('scalar_or_mapping', mapping_parser_func=_parse_expression),
+    "test_only": _RuleDesc('bool_scalar'),
+    "deprecated_name": _RuleDesc('scalar_or_sequence'),
+    "validator": _RuleDesc('mapping', mapping_parser_func=_parse_validator),
+    "on_update": _RuleDesc("scalar"),
+    "cpp_class": _RuleDesc('scalar_or_mapping', mapping_parser_func=_parse_server_parameter_class),
+}  # type: Dict[unicode, _RuleDesc]
+
+
 def _parse_server_parameter(ctxt, spec, name, node):
     # type: (errors.ParserContext, syntax.IDLSpec, unicode, Union[yaml.nodes.MappingNode, yaml.nodes.ScalarNode, yaml.nodes.SequenceNode]) -> None
     """Parse a server_parameters section in the IDL file."""
@@ -570,28 +645,35 @@ def _parse_server_parameter(ctxt, spec, name, node):
     param = syntax.ServerParameter(ctxt.file_name, node.start_mark.line, node.start_mark.column)
     param.name = name
 
-    # Declare as local to avoid ugly formatting with long line.
-    map_class = _parse_server_parameter_class
-
-    _generic_parser(
-        ctxt, node, "server_parameters", param, {
-            "set_at": _RuleDesc('scalar_or_sequence', _RuleDesc.REQUIRED),
-            "description": _RuleDesc('scalar', _RuleDesc.REQUIRED),
-            "cpp_vartype": _RuleDesc('scalar'),
-            "cpp_varname": _RuleDesc('scalar'),
-            "condition": _RuleDesc('mapping', mapping_parser_func=_parse_condition),
-            "redact": _RuleDesc('bool_scalar'),
-            "default": _RuleDesc('scalar_or_mapping', mapping_parser_func=_parse_expression),
-            "test_only": _RuleDesc('bool_scalar'),
-            "deprecated_name": _RuleDesc('scalar_or_sequence'),
-            "validator": _RuleDesc('mapping', mapping_parser_func=_parse_validator),
-            "on_update": _RuleDesc("scalar"),
-            "cpp_class": _RuleDesc('scalar_or_mapping', mapping_parser_func=map_class),
-        })
+    _generic_parser(ctxt, node, "server_parameters", param, _SERVER_PARAMETER_RULES)
 
     spec.server_parameters.append(param)
 
 
+_CONFIG_OPTION_RULES = {
+    "short_name": _RuleDesc('scalar'),
+    "single_name": _RuleDesc('scalar'),
+    "deprecated_name": _RuleDesc('scalar_or_sequence'),
+    "deprecated_short_name": _RuleDesc('scalar_or_sequence'),
+    "description": _RuleDesc('scalar', _RuleDesc.REQUIRED),
+    "section": _RuleDesc('scalar'),
+    "arg_vartype": _RuleDesc('scalar', _RuleDesc.REQUIRED),
+    "cpp_vartype": _RuleDesc('scalar'),
+    "cpp_varname": _RuleDesc('scalar'),
+    "condition": _RuleDesc('mapping', mapping_parser_func=_parse_condition),
+    "conflicts": _RuleDesc('scalar_or_sequence'),
+    "requires": _RuleDesc('scalar_or_sequence'),
+    "hidden": _RuleDesc('bool_scalar'),
+    "redact": _RuleDesc('bool_scalar'),
+    "default": _RuleDesc('scalar_or_mapping', mapping_parser_func=_parse_expression),
+    "implicit": _RuleDesc('scalar_or_mapping', mapping_parser_func=_parse_expression),
+    "source": _RuleDesc('scalar_or_sequence'),
+    "duplicate_behavior": _RuleDesc('scalar'),
+    "positional": _RuleDesc('scalar'),
+    "validator": _RuleDesc('mapping', mapping_parser_func=_parse_validator),
+}  # type: Dict[unicode, _RuleDesc]
+
+
 def _parse_config_option(ctxt, spec, name, node):
     # type: (errors.ParserContext, syntax.IDLSpec, unicode, Union[yaml.nodes.MappingNode, yaml.nodes.ScalarNode, yaml.nodes.SequenceNode]) -> None
     """Parse a configs section in the IDL file."""
@@ -601,29 +683,7 @@ def _parse_config_option(ctxt, spec, name, node):
     option = syntax.ConfigOption(ctxt.file_name, node.start_mark.line, node.start_mark.column)
     option.name = name
 
-    _generic_parser(
-        ctxt, node, "configs", option, {
-            "short_name": _RuleDesc('scalar'),
-            "single_name": _RuleDesc('scalar'),
-            "deprecated_name": _RuleDesc('scalar_or_sequence'),
-            "deprecated_short_name": _RuleDesc('scalar_or_sequence'),
-            "description": _RuleDesc('scalar', _RuleDesc.REQUIRED),
-            "section": _RuleDesc('scalar'),
-            "arg_vartype": _RuleDesc('scalar', _RuleDesc.REQUIRED),
-            "cpp_vartype": _RuleDesc('scalar'),
-            "cpp_varname": _RuleDesc('scalar'),
-            "condition": _RuleDesc('mapping', mapping_parser_func=_parse_condition),
-            "conflicts": _RuleDesc('scalar_or_sequence'),
-            "requires": _RuleDesc('scalar_or_sequence'),
-            "hidden": _RuleDesc('bool_scalar'),
-            "redact": _RuleDesc('bool_scalar'),
-            "default": _RuleDesc('scalar_or_mapping', mapping_parser_func=_parse_expression),
-            "implicit": _RuleDesc('scalar_or_mapping', mapping_parser_func=_parse_expression),
-            "source": _RuleDesc('scalar_or_sequence'),
-            "duplicate_behavior": _RuleDesc('scalar'),
-            "positional": _RuleDesc('scalar'),
-            "validator": _RuleDesc('mapping', mapping_parser_func=_parse_validator),
-        })
+    _generic_parser(ctxt, node, "configs", option, _CONFIG_OPTION_RULES)
 
     spec.configs.append(option)
 
@@ -658,18 +718,33 @@ def _propagate_globals(spec):
         idltype.cpp_type = _prefix_with_namespace(cpp_namespace, idltype.cpp_type)
 
 
-def _parse(stream, error_file_name):
-    # type: (Any, unicode) -> syntax.IDLParsedSpec
+def _section_parser(syntax_node_name, func):
+    # type: (unicode, Callable[[errors.ParserContext,syntax.IDLSpec,unicode,Any], None]) -> Callable[[errors.ParserContext,syntax.IDLSpec,Any], None]
+    """Return a parser for a top-level mapping section which calls func for each item."""
+    return functools.partial(_parse_mapping, syntax_node_name=syntax_node_name, func=func)
+
+
+# Map of root node name to the parser for that section of the IDL document
+_ROOT_SECTION_PARSERS = {
+    "global": _parse_global,
+    "imports": _parse_imports,
+    "enums": _section_parser("enums", _parse_enum),
+    "types": _section_parser("types", _parse_type),
+    "structs": _section_parser("structs", _parse_struct),
+    "commands": _section_parser("commands", _parse_command),
+    "server_parameters": _section_parser("server_parameters", _parse_server_parameter),
+    "configs": _section_parser("configs", _parse_config_option),
+}  # type: Dict[unicode, Callable[[errors.ParserContext,syntax.IDLSpec,Any], None]]
+
+
+def _parse(root_node, error_file_name):
+    # type: (yaml.nodes.Node, unicode) -> syntax.IDLParsedSpec
     """
-    Parse a YAML document into an idl.syntax tree.
+    Parse a composed YAML document into an idl.syntax tree.
 
-    stream: is a io.Stream.
+    root_node: is the root node returned by yaml.compose.
     error_file_name: just a file name for error messages to use.
     """
-    # pylint: disable=too-many-branches
-
-    # This will raise an exception if the YAML parse fails
-    root_node = yaml.compose(stream)
 
     ctxt = errors.ParserContext(error_file_name, errors.ParserErrorCollection())
 
@@ -694,22 +769,9 @@ def _parse(stream, error_file_name):
             ctxt.add_duplicate_error(first_node, first_name)
             continue
 
-        if first_name == "global":
-            _parse_global(ctxt, spec, second_node)
-        elif first_name == "imports":
-            _parse_imports(ctxt, spec, second_node)
-        elif first_name == "enums":
-            _parse_mapping(ctxt, spec, second_node, 'enums', _parse_enum)
-        elif first_name == "types":
-            _parse_mapping(ctxt, spec, second_node, 'types', _parse_type)
-        elif first_name == "structs":
-            _parse_mapping(ctxt, spec, second_node, 'structs', _parse_struct)
-        elif first_name == "commands":
-            _parse_mapping(ctxt, spec, second_node, 'commands', _parse_command)
-        elif first_name == "server_parameters":
-            _parse_mapping(ctxt, spec, second_node, "server_parameters", _parse_server_parameter)
-        elif first_name == "configs":
-            _parse_mapping(ctxt, spec, second_node, "configs", _parse_config_option)
+        section_parser = _ROOT_SECTION_PARSERS.get(first_name)
+        if section_parser is not None:
+            section_parser(ctxt, spec, second_node)
         else:
             ctxt.add_unknown_root_node_error(first_node)
 
@@ -746,17 +808,24 @@ class ImportResolverBase(object):
         pass
 
 
-def parse(stream, input_file_name, resolver):
-    # type: (Any, unicode, ImportResolverBase) -> syntax.IDLParsedSpec
+def parse(stream, input_file_name, resolver, node_cache=None):
+    # type: (Any, unicode, ImportResolverBase, Optional[Dict[unicode, Any]]) -> syntax.IDLParsedSpec
     """
     Parse a YAML document into an idl.syntax tree.
 
     stream: is a io.Stream.
     input_file_name: a file name for error messages to use, and to help resolve imported files.
+    node_cache: an optional dictionary of resolved file names to composed YAML documents, used to
+    avoid reading and composing the same imported file again across calls to parse.
     """
-    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-locals,too-many-branches
 
-    root_doc = _parse(stream, input_file_name)
+    # This will raise an exception if the YAML parse fails
+    root_node = yaml.compose(stream, Loader=_YamlLoader)
+    if node_cache is not None:
+        node_cache[os.path.normpath(os.path.abspath(input_file_name))] = root_node
+
+    root_doc = _parse(root_node, input_file_name)
 
     if root_doc.errors:
         return root_doc
@@ -792,8 +861,15 @@ def parse(stream, input_file_name, resolver):
         resolved_file_names.append(resolved_file_name)
 
         # Parse imported file
-        with resolver.open(resolved_file_name) as file_stream:
-            parsed_doc = _parse(file_stream, resolved_file_name)
+        imported_node = node_cache.get(resolved_file_name) if node_cache is not None else None
+        if imported_node is None:
+            with resolver.open(resolved_file_name) as file_stream:
+                imported_node = yaml.compose(file_stream, Loader=_YamlLoader)
+
+            if node_cache is not None:
+                node_cache[resolved_file_name] = imported_node
+
+        parsed_doc = _parse(imported_node, resolved_file_name)
 
         # Check for errors
         if parsed_doc.errors:
@@ -35,8 +35,7 @@ it follows the rules of the IDL, etc.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-import itertools
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from . import common
 from . import errors
@@ -87,19 +86,6 @@ def parse_array_type(name):
     return name
 
 
-def _zip_scalar(items, obj):
-    # type: (List[Any], Any) -> Iterator[Tuple[Any, Any]]
-    """Return an Iterator of (obj, list item) tuples."""
-    return ((item, obj) for item in items)
-
-
-def _item_and_type(dic):
-    # type: (Dict[Any, List[Any]]) -> Iterator[Tuple[Any, Any]]
-    """Return an Iterator of (key, value) pairs from a dictionary."""
-    return itertools.chain.from_iterable(
-        (_zip_scalar(value, key) for (key, value) in dic.viewitems()))
-
-
 class SymbolTable(object):
     """
     IDL Symbol Table.
@@ -116,43 +102,43 @@ class SymbolTable(object):
         self.structs = []  # type: List[Struct]
         self.types = []  # type: List[Type]
 
-    def _is_duplicate(self, ctxt, location, name, duplicate_class_name):
-        # type: (errors.ParserContext, common.SourceLocation, unicode, unicode) -> bool
-        """Return true if the given item already exist in the symbol table."""
-        for (item, entity_type) in _item_and_type({
-                "command": self.commands,
-                "enum": self.enums,
-                "struct": self.structs,
-                "type": self.types,
-        }):
-            if item.name == name:
-                ctxt.add_duplicate_symbol_error(location, name, duplicate_class_name, entity_type)
-                return True
-
-        return False
+        # Map of symbol name to (entity type, item) across the union of (commands, enums, types,
+        # structs)
+        self._symbols = {}  # type: Dict[unicode, Tuple[unicode, Any]]
+
+    def _add_symbol(self, ctxt, item, entity_type):
+        # type: (errors.ParserContext, Union[Command, Enum, Struct, Type], unicode) -> bool
+        """Add an item to the symbol map, return false if the name already exists."""
+        duplicate = self._symbols.get(item.name)
+        if duplicate is not None:
+            ctxt.add_duplicate_symbol_error(item, item.name, entity_type, duplicate[0])
+            return False
+
+        self._symbols[item.name] = (entity_type, item)
+        return True
 
     def add_enum(self, ctxt, idl_enum):
         # type: (errors.ParserContext, Enum) -> None
         """Add an IDL enum to the symbol table and check for duplicates."""
-        if not self._is_duplicate(ctxt, idl_enum, idl_enum.name, "enum"):
+        if self._add_symbol(ctxt, idl_enum, "enum"):
             self.enums.append(idl_enum)
 
     def add_struct(self, ctxt, struct):
         # type: (errors.ParserContext, Struct) -> None
         """Add an IDL struct to the symbol table and check for duplicates."""
-        if not self._is_duplicate(ctxt, struct, struct.name, "struct"):
+        if self._add_symbol(ctxt, struct, "struct"):
             self.structs.append(struct)
 
     def add_type(self, ctxt, idltype):
         # type: (errors.ParserContext, Type) -> None
         """Add an IDL type to the symbol table and check for duplicates."""
-        if not self._is_duplicate(ctxt, idltype, idltype.name, "type"):
+        if self._add_symbol(ctxt, idltype, "type"):
             self.types.append(idltype)
 
     def add_command(self, ctxt, command):
         # type: (errors.ParserContext, Command) -> None
         """Add an IDL command to the symbol table and check for duplicates."""
-        if not self._is_duplicate(ctxt, command, command.name, "command"):
+        if self._add_symbol(ctxt, command, "command"):
             self.commands.append(command)
 
     def add_imported_symbol_table(self, ctxt, imported_symbols):
@@ -163,17 +149,17 @@ class SymbolTable(object):
         Marks imported structs as imported, and errors on duplicate symbols.
         """
         for command in imported_symbols.commands:
-            if not self._is_duplicate(ctxt, command, command.name, "command"):
+            if self._add_symbol(ctxt, command, "command"):
                 command.imported = True
                 self.commands.append(command)
 
         for struct in imported_symbols.structs:
-            if not self._is_duplicate(ctxt, struct, struct.name, "struct"):
+            if self._add_symbol(ctxt, struct, "struct"):
                 struct.imported = True
                 self.structs.append(struct)
 
         for idl_enum in imported_symbols.enums:
-            if not self._is_duplicate(ctxt, idl_enum, idl_enum.name, "enum"):
+            if self._add_symbol(ctxt, idl_enum, "enum"):
                 idl_enum.imported = True
                 self.enums.append(idl_enum)
 
@@ -188,23 +174,9 @@ class SymbolTable(object):
     def _resolve_field_type(self, ctxt, location, field_name, type_name):
         # type: (errors.ParserContext, common.SourceLocation, unicode, unicode) -> Optional[Union[Command, Enum, Struct, Type]]
         """Find the type or struct a field refers to or log an error."""
-        # pylint: disable=too-many-return-statements
-
-        for command in self.commands:
-            if command.name == type_name:
-                return command
-
-        for idl_enum in self.enums:
-            if idl_enum.name == type_name:
-                return idl_enum
-
-        for struct in self.structs:
-            if struct.name == type_name:
-                return struct
-
-        for idltype in self.types:
-            if idltype.name == type_name:
-                return idltype
+        symbol = self._symbols.get(type_name)
+        if symbol is not None:
+            return symbol[1]
 
         if type_name.startswith('array<'):
             array_type_name = parse_array_type(type_name)
@@ -227,6 +199,8 @@ class Global(common.SourceLocation):
     populated.
     """
 
+    __slots__ = ('cpp_namespace', 'cpp_includes', 'configs')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct a Global."""
@@ -240,6 +214,8 @@ class Global(common.SourceLocation):
 class Import(common.SourceLocation):
     """IDL imports object."""
 
+    __slots__ = ('imports', 'resolved_imports', 'dependencies')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct an Imports section."""
@@ -265,6 +241,9 @@ class Type(common.SourceLocation):
 
     # pylint: disable=too-many-instance-attributes
 
+    __slots__ = ('name', 'description', 'cpp_type', 'bson_serialization_type', 'bindata_subtype',
+                 'serializer', 'deserializer', 'default')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct a Type."""
@@ -290,6 +269,8 @@ class Validator(common.SourceLocation):
 
     # pylint: disable=too-many-instance-attributes
 
+    __slots__ = ('gt', 'lt', 'gte', 'lte', 'callback')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct a Validator."""
@@ -315,6 +296,10 @@ class Field(common.SourceLocation):
 
     # pylint: disable=too-many-instance-attributes
 
+    __slots__ = ('name', 'cpp_name', 'description', 'type', 'ignore', 'optional', 'default',
+                 'supports_doc_sequence', 'comparison_order', 'validator',
+                 'serialize_op_msg_request_only', 'constructed')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct a Field."""
@@ -343,6 +328,8 @@ class ChainedStruct(common.SourceLocation):
     The fields name, and cpp_name are required.
     """
 
+    __slots__ = ('name', 'cpp_name')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct a Type."""
@@ -359,6 +346,8 @@ class ChainedType(common.SourceLocation):
     The fields name, and cpp_name are required.
     """
 
+    __slots__ = ('name', 'cpp_name')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct a Type."""
@@ -377,6 +366,10 @@ class Struct(common.SourceLocation):
 
     # pylint: disable=too-many-instance-attributes
 
+    __slots__ = ('name', 'description', 'strict', 'immutable', 'inline_chained_structs',
+                 'generate_comparison_operators', 'chained_types', 'chained_structs', 'fields',
+                 'cpp_name', 'imported', 'cpp_namespace')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct a Struct."""
@@ -410,6 +403,8 @@ class Command(Struct):
     Namespace is required.
     """
 
+    __slots__ = ('namespace', 'type')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct a Command."""
@@ -426,6 +421,8 @@ class EnumValue(common.SourceLocation):
     All fields are either required or have a non-None default.
     """
 
+    __slots__ = ('name', 'value')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct an Enum."""
@@ -442,6 +439,8 @@ class Enum(common.SourceLocation):
     All fields are either required or have a non-None default.
     """
 
+    __slots__ = ('name', 'description', 'type', 'values', 'imported', 'cpp_namespace')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct an Enum."""
@@ -463,6 +462,8 @@ class Enum(common.SourceLocation):
 class Condition(common.SourceLocation):
     """Condition(s) for a ServerParameter or ConfigOption."""
 
+    __slots__ = ('expr', 'constexpr', 'preprocessor')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct a Condition."""
@@ -476,6 +477,8 @@ class Condition(common.SourceLocation):
 class Expression(common.SourceLocation):
     """Description of a valid C++ expression."""
 
+    __slots__ = ('literal', 'expr', 'is_constexpr')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct an Expression."""
@@ -490,6 +493,8 @@ class Expression(common.SourceLocation):
 class ServerParameterClass(common.SourceLocation):
     """ServerParameter as C++ class specialization."""
 
+    __slots__ = ('name', 'data', 'override_ctor', 'override_set')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct a ServerParameterClass."""
@@ -507,6 +512,10 @@ class ServerParameter(common.SourceLocation):
 
     # pylint: disable=too-many-instance-attributes
 
+    __slots__ = ('name', 'set_at', 'description', 'cpp_vartype', 'cpp_varname', 'cpp_class',
+                 'condition', 'deprecated_name', 'redact', 'test_only', 'default', 'validator',
+                 'on_update')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct a ServerParameter."""
@@ -532,6 +541,8 @@ class ServerParameter(common.SourceLocation):
 class ConfigGlobal(common.SourceLocation):
     """Global values to apply to all ConfigOptions."""
 
+    __slots__ = ('section', 'source', 'initializer_name')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct a ConfigGlobal."""
@@ -547,6 +558,11 @@ class ConfigOption(common.SourceLocation):
 
     # pylint: disable=too-many-instance-attributes
 
+    __slots__ = ('name', 'deprecated_name', 'short_name', 'single_name', 'deprecated_short_name',
+                 'description', 'section', 'arg_vartype', 'cpp_vartype', 'cpp_varname', 'condition',
+                 'conflicts', 'requires', 'hidden', 'redact', 'default', 'implicit', 'source',
+                 'duplicate_behavior', 'positional', 'validator')
+
     def __init__(self, file_name, line, column):
         # type: (unicode, int, int) -> None
         """Construct a ConfigOption."""
@@ -42,11 +42,7 @@ _INDENT_SPACE_COUNT = 4
 def _fill_spaces(count):
     # type: (int) -> unicode
     """Fill a string full of spaces."""
-    fill = ''
-    for _ in range(count * _INDENT_SPACE_COUNT):
-        fill += ' '
-
-    return fill
+    return ' ' * (count * _INDENT_SPACE_COUNT)
 
 
 def _indent_text(count, unindented_text):
@@ -38,9 +38,15 @@ $ coverage run run_tests.py && coverage html
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import io
 import os
+import re
+import shutil
+import tempfile
 import unittest
 
+import mock
+
 # import package so that it works regardless of whether we run as a module or file
 if __package__ is None:
     import sys
@@ -51,36 +57,169 @@ else:
     from .context import idl
     from . import testcase
 
+# Directories are resolved once at import since every compile test needs them
+_BASE_DIR = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+_SRC_DIR = os.path.join(
+    _BASE_DIR,
+    'src',
+)
+_IDL_DIR = os.path.join(_SRC_DIR, 'mongo', 'idl')
+_UNITTEST_IDL_FILE = os.path.join(_IDL_DIR, 'unittest.idl')
+
+_skip_unless_unittest_idl = unittest.skipUnless(  # pylint: disable=invalid-name
+    os.path.exists(_UNITTEST_IDL_FILE),
+    "Skipping IDL Generator testing since %s could not be found." % (_UNITTEST_IDL_FILE))
+
+# Matches a getValue() getter marked as const with no other occurrence of the word "const" before it
+_GETVALUE_CONST_GETTER_RE = re.compile(r'^(?:(?!const).)+getValue(?:(?!const).)*const \{',
+                                       re.MULTILINE)
+
 
 class TestGenerator(testcase.IDLTestcase):
     """Test the IDL Generator."""
 
+    def _compile_unittest_idl(self, idl_file_name):
+        # type: (unicode) -> None
+        """Compile an IDL file from src/mongo/idl so code coverage can be measured."""
+        args = idl.compiler.CompilerArgs()
+        args.output_suffix = "_codecoverage_gen"
+        args.import_directories = [_SRC_DIR]
+        args.cache_dir = None
+
+        args.input_file = os.path.join(_IDL_DIR, idl_file_name)
+        self.assertTrue(idl.compiler.compile_idl(args))
+
+    @_skip_unless_unittest_idl
+    def test_compile_import(self):
+        # type: () -> None
+        """Exercise the code generator with unittest_import.idl."""
+        self._compile_unittest_idl('unittest_import.idl')
+
+    @_skip_unless_unittest_idl
     def test_compile(self):
         # type: () -> None
         """Exercise the code generator so code coverage can be measured."""
-        base_dir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-        src_dir = os.path.join(
-            base_dir,
-            'src',
-        )
-        idl_dir = os.path.join(src_dir, 'mongo', 'idl')
+        self._compile_unittest_idl('unittest.idl')
 
+    @_skip_unless_unittest_idl
+    def test_compile_batch(self):
+        # type: () -> None
+        """Validate files imported by several IDL files in one batch are only read once."""
         args = idl.compiler.CompilerArgs()
         args.output_suffix = "_codecoverage_gen"
-        args.import_directories = [src_dir]
+        args.import_directories = [_SRC_DIR]
+        args.cache_dir = None
 
-        unittest_idl_file = os.path.join(idl_dir, 'unittest.idl')
-        if not os.path.exists(unittest_idl_file):
-            unittest.skip("Skipping IDL Generator testing since %s could not be found." %
-                          (unittest_idl_file))
-            return
+        resolver_open = idl.compiler.CompilerImportResolver.open
+        with mock.patch.object(idl.compiler.CompilerImportResolver, 'open', autospec=True,
+                               side_effect=resolver_open) as mock_open:
+            self.assertTrue(
+                idl.compiler.compile_idl_batch(
+                    args, [os.path.join(_IDL_DIR, 'unittest_import.idl'), _UNITTEST_IDL_FILE]))
 
-        args.input_file = os.path.join(idl_dir, 'unittest_import.idl')
-        self.assertTrue(idl.compiler.compile_idl(args))
+        # basic_types.idl is imported by both files, and unittest_import.idl was composed as the
+        # first input file, so neither is opened again while compiling unittest.idl
+        opened_file_names = [os.path.basename(call[0][1]) for call in mock_open.call_args_list]
+        self.assertEqual(['basic_types.idl'], opened_file_names)
 
-        args.input_file = unittest_idl_file
-        self.assertTrue(idl.compiler.compile_idl(args))
+    def test_compile_batch_output_file(self):
+        # type: () -> None
+        """Validate compile_idl_batch rejects explicit output file names."""
+        args = idl.compiler.CompilerArgs()
+        args.output_header = "unittest.h"
+
+        with self.assertRaises(ValueError):
+            idl.compiler.compile_idl_batch(args, [_UNITTEST_IDL_FILE])
+
+    @_skip_unless_unittest_idl
+    def test_compile_cache(self):
+        # type: () -> None
+        """Validate a second compile with a cache directory restores the same generated files."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            cache_dir = os.path.join(temp_dir, 'cache')
+            output_file_names = [
+                os.path.join(temp_dir, 'unittest_import.h'),
+                os.path.join(temp_dir, 'unittest_import.cpp')
+            ]
+
+            args = idl.compiler.CompilerArgs()
+            args.output_suffix = "_codecoverage_gen"
+            args.import_directories = [_SRC_DIR]
+            args.cache_dir = cache_dir
+            args.input_file = os.path.join(_IDL_DIR, 'unittest_import.idl')
+            args.output_header, args.output_source = output_file_names
+
+            self.assertTrue(idl.compiler.compile_idl(args))
+            self.assertEqual(1, len(os.listdir(cache_dir)))
+
+            cache_entry_dir = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+            for file_name in os.listdir(cache_entry_dir):
+                with io.open(os.path.join(cache_entry_dir, file_name), 'w') as cached_file:
+                    cached_file.write("// cached\n")
+
+            # Remove the generated files so they are restored from the cache directory
+            for file_name in output_file_names:
+                os.remove(file_name)
+
+            self.assertTrue(idl.compiler.compile_idl(args))
+            self.assertEqual(1, len(os.listdir(cache_dir)))
+
+            for file_name in output_file_names:
+                with io.open(file_name) as generated_file:
+                    self.assertEqual("// cached\n", generated_file.read())
+        finally:
+            shutil.rmtree(temp_dir)
+
+    @_skip_unless_unittest_idl
+    def test_compile_cache_not_writable(self):
+        # type: () -> None
+        """Validate a failure to populate the cache does not fail the compile."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            # A file where the cache directory should be makes creating the cache directory fail
+            cache_dir = os.path.join(temp_dir, 'cache')
+            with io.open(cache_dir, 'w') as cache_file:
+                cache_file.write("not a directory\n")
+
+            args = idl.compiler.CompilerArgs()
+            args.output_suffix = "_codecoverage_gen"
+            args.import_directories = [_SRC_DIR]
+            args.cache_dir = cache_dir
+            args.input_file = os.path.join(_IDL_DIR, 'unittest_import.idl')
+            args.output_header = os.path.join(temp_dir, 'unittest_import.h')
+            args.output_source = os.path.join(temp_dir, 'unittest_import.cpp')
+
+            self.assertTrue(idl.compiler.compile_idl(args))
+            self.assertTrue(os.path.exists(args.output_header))
+        finally:
+            shutil.rmtree(temp_dir)
+
+    @_skip_unless_unittest_idl
+    def test_compile_cache_output_suffix(self):
+        # type: () -> None
+        """Validate the output suffix is part of the cache key since it names imported headers."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            cache_dir = os.path.join(temp_dir, 'cache')
+            header_file_name = os.path.join(temp_dir, 'unittest.h')
+
+            for output_suffix in ["_codecoverage_gen", "_other_gen"]:
+                args = idl.compiler.CompilerArgs()
+                args.output_suffix = output_suffix
+                args.import_directories = [_SRC_DIR]
+                args.cache_dir = cache_dir
+                args.input_file = _UNITTEST_IDL_FILE
+                args.output_source = os.path.join(temp_dir, 'unittest.cpp')
+                args.output_header = header_file_name
+                self.assertTrue(idl.compiler.compile_idl(args))
+
+            self.assertEqual(2, len(os.listdir(cache_dir)))
+            with io.open(header_file_name) as header_file:
+                self.assertIn("unittest_import_other_gen.h", header_file.read())
+        finally:
+            shutil.rmtree(temp_dir)
 
     def test_enum_non_const(self):
         # type: () -> None
@@ -107,14 +246,7 @@ class TestGenerator(testcase.IDLTestcase):
         # Make sure the getter is marked as const.
         # Make sure the return type is not marked as const by validating the getter marked as const
         # is the only occurrence of the word "const".
-        header_lines = header.split('\n')
-
-        found = False
-        for header_line in header_lines:
-            if header_line.find("getValue") > 0 \
-                and header_line.find("const {") > 0 \
-                and header_line.find("const {") == header_line.find("const"):
-                found = True
+        found = _GETVALUE_CONST_GETTER_RE.search(header) is not None
 
         self.assertTrue(found, "Bad Header: " + header)
 
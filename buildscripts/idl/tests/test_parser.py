@@ -46,6 +46,45 @@ else:
     from .context import idl
     from . import testcase
 
+# Common types shared by the command test cases
+_COMMAND_TEST_PREAMBLE = """
+types:
+    string:
+        description: foo
+        cpp_type: foo
+        bson_serialization_type: string
+        serializer: foo
+        deserializer: foo
+        default: foo
+"""
+
+# Command test document with a command and a struct of the same name
+_COMMAND_STRUCT_SAME_NAME_DOC = _COMMAND_TEST_PREAMBLE + textwrap.dedent("""
+    commands:
+        foo:
+            description: foo
+            namespace: ignored
+            fields:
+                foo: string
+
+    structs:
+        foo:
+            description: foo
+            fields:
+                foo: foo
+    """)
+
+# Command test document with a command and a type of the same name
+_COMMAND_TYPE_SAME_NAME_DOC = _COMMAND_TEST_PREAMBLE + textwrap.dedent("""
+    commands:
+        string:
+            description: foo
+            namespace: ignored
+            strict: true
+            fields:
+                foo: string
+    """)
+
 
 class TestParser(testcase.IDLTestcase):
     # pylint: disable=too-many-public-methods
@@ -951,44 +990,11 @@ class TestParser(testcase.IDLTestcase):
                     foo: bar
             """), idl.errors.ERROR_ID_BAD_COMMAND_NAMESPACE)
 
-        # Setup some common types
-        test_preamble = textwrap.dedent("""
-        types:
-            string:
-                description: foo
-                cpp_type: foo
-                bson_serialization_type: string
-                serializer: foo
-                deserializer: foo
-                default: foo
-        """)
-
         # Commands and structs with same name
-        self.assert_parse_fail(test_preamble + textwrap.dedent("""
-            commands: 
-                foo:
-                    description: foo
-                    namespace: ignored
-                    fields:
-                        foo: string
-            
-            structs:
-                foo:
-                    description: foo
-                    fields:
-                        foo: foo
-            """), idl.errors.ERROR_ID_DUPLICATE_SYMBOL)
+        self.assert_parse_fail(_COMMAND_STRUCT_SAME_NAME_DOC, idl.errors.ERROR_ID_DUPLICATE_SYMBOL)
 
         # Commands and types with same name
-        self.assert_parse_fail(test_preamble + textwrap.dedent("""
-            commands: 
-                string:
-                    description: foo
-                    namespace: ignored
-                    strict: true
-                    fields:
-                        foo: string
-            """), idl.errors.ERROR_ID_DUPLICATE_SYMBOL)
+        self.assert_parse_fail(_COMMAND_TYPE_SAME_NAME_DOC, idl.errors.ERROR_ID_DUPLICATE_SYMBOL)
 
         # Namespace concatenate_with_db
         self.assert_parse_fail(
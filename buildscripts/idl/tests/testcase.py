@@ -45,7 +45,7 @@ def errors_to_str(errors):
     # type: (idl.errors.ParserErrorCollection) -> unicode
     """Dump the list of errors as a multiline text string."""
     if errors is not None:
-        return "\n".join(errors.to_list())
+        return "\n".join(errors)
     return "<empty>"
 
 
@@ -63,6 +63,10 @@ class NothingImportResolver(idl.parser.ImportResolverBase):
         raise NotImplementedError()
 
 
+# Shared stateless resolver used when a test document has no imports
+_NOTHING_IMPORT_RESOLVER = NothingImportResolver()
+
+
 class IDLTestcase(unittest.TestCase):
     """IDL Test case base class."""
 
@@ -78,19 +82,19 @@ class IDLTestcase(unittest.TestCase):
     def _assert_parse(self, doc_str, parsed_doc):
         # type: (unicode, idl.syntax.IDLParsedSpec) -> None
         """Assert a document parsed correctly by the IDL compiler and returned no errors."""
-        self.assertIsNone(parsed_doc.errors,
-                          "Expected no parser errors\nFor document:\n%s\nReceived errors:\n\n%s" %
-                          (doc_str, errors_to_str(parsed_doc.errors)))
+        if parsed_doc.errors is not None:
+            self.fail("Expected no parser errors\nFor document:\n%s\nReceived errors:\n\n%s" %
+                      (doc_str, errors_to_str(parsed_doc.errors)))
         self.assertIsNotNone(parsed_doc.spec, "Expected a parsed doc")
 
-    def assert_parse(self, doc_str, resolver=NothingImportResolver()):
+    def assert_parse(self, doc_str, resolver=_NOTHING_IMPORT_RESOLVER):
         # type: (unicode, idl.parser.ImportResolverBase) -> None
         """Assert a document parsed correctly by the IDL compiler and returned no errors."""
         parsed_doc = self._parse(doc_str, resolver)
         self._assert_parse(doc_str, parsed_doc)
 
     def assert_parse_fail(self, doc_str, error_id, multiple=False,
-                          resolver=NothingImportResolver()):
+                          resolver=_NOTHING_IMPORT_RESOLVER):
         # type: (unicode, unicode, bool, idl.parser.ImportResolverBase) -> None
         """
         Assert a document parsed correctly by the YAML parser, but not the by the IDL compiler.
@@ -104,17 +108,17 @@ class IDLTestcase(unittest.TestCase):
 
         # Assert that negative test cases are only testing one fault in a test.
         # This is impossible to assert for all tests though.
-        self.assertTrue(
-            multiple or parsed_doc.errors.count() == 1,
-            "For document:\n%s\nExpected only error message '%s' but received multiple errors:\n\n%s"
-            % (doc_str, error_id, errors_to_str(parsed_doc.errors)))
+        if not multiple and parsed_doc.errors.count() != 1:
+            self.fail(
+                "For document:\n%s\nExpected only error message '%s' but received multiple errors:\n\n%s"
+                % (doc_str, error_id, errors_to_str(parsed_doc.errors)))
 
-        self.assertTrue(
-            parsed_doc.errors.contains(error_id),
-            "For document:\n%s\nExpected error message '%s' but received only errors:\n %s" %
-            (doc_str, error_id, errors_to_str(parsed_doc.errors)))
+        if not parsed_doc.errors.contains(error_id):
+            self.fail(
+                "For document:\n%s\nExpected error message '%s' but received only errors:\n %s" %
+                (doc_str, error_id, errors_to_str(parsed_doc.errors)))
 
-    def assert_bind(self, doc_str, resolver=NothingImportResolver()):
+    def assert_bind(self, doc_str, resolver=_NOTHING_IMPORT_RESOLVER):
         # type: (unicode, idl.parser.ImportResolverBase) -> idl.ast.IDLBoundSpec
         """Assert a document parsed and bound correctly by the IDL compiler and returned no errors."""
         parsed_doc = self._parse(doc_str, resolver)
@@ -122,14 +126,14 @@ class IDLTestcase(unittest.TestCase):
 
         bound_doc = idl.binder.bind(parsed_doc.spec)
 
-        self.assertIsNone(bound_doc.errors,
-                          "Expected no binder errors\nFor document:\n%s\nReceived errors:\n\n%s" %
-                          (doc_str, errors_to_str(bound_doc.errors)))
+        if bound_doc.errors is not None:
+            self.fail("Expected no binder errors\nFor document:\n%s\nReceived errors:\n\n%s" %
+                      (doc_str, errors_to_str(bound_doc.errors)))
         self.assertIsNotNone(bound_doc.spec, "Expected a bound doc")
 
         return bound_doc.spec
 
-    def assert_bind_fail(self, doc_str, error_id, resolver=NothingImportResolver()):
+    def assert_bind_fail(self, doc_str, error_id, resolver=_NOTHING_IMPORT_RESOLVER):
         # type: (unicode, unicode, idl.parser.ImportResolverBase) -> None
         """
         Assert a document parsed correctly by the YAML parser and IDL parser, but not bound by the IDL binder.
@@ -141,21 +145,22 @@ class IDLTestcase(unittest.TestCase):
 
         bound_doc = idl.binder.bind(parsed_doc.spec)
 
-        self.assertIsNone(bound_doc.spec, "Expected no bound doc\nFor document:\n%s\n" % (doc_str))
+        if bound_doc.spec is not None:
+            self.fail("Expected no bound doc\nFor document:\n%s\n" % (doc_str))
         self.assertIsNotNone(bound_doc.errors, "Expected binder errors")
 
         # Assert that negative test cases are only testing one fault in a test.
-        self.assertTrue(
-            bound_doc.errors.count() == 1,
-            "For document:\n%s\nExpected only error message '%s' but received multiple errors:\n\n%s"
-            % (doc_str, error_id, errors_to_str(bound_doc.errors)))
+        if bound_doc.errors.count() != 1:
+            self.fail(
+                "For document:\n%s\nExpected only error message '%s' but received multiple errors:\n\n%s"
+                % (doc_str, error_id, errors_to_str(bound_doc.errors)))
 
-        self.assertTrue(
-            bound_doc.errors.contains(error_id),
-            "For document:\n%s\nExpected error message '%s' but received only errors:\n %s" %
-            (doc_str, error_id, errors_to_str(bound_doc.errors)))
+        if not bound_doc.errors.contains(error_id):
+            self.fail(
+                "For document:\n%s\nExpected error message '%s' but received only errors:\n %s" %
+                (doc_str, error_id, errors_to_str(bound_doc.errors)))
 
-    def assert_generate(self, doc_str, resolver=NothingImportResolver()):
+    def assert_generate(self, doc_str, resolver=_NOTHING_IMPORT_RESOLVER):
         # type: (unicode, idl.parser.ImportResolverBase) -> Tuple[unicode,unicode]
         """Assert a document parsed, bound, and generated correctly by the IDL compiler."""
         spec = self.assert_bind(doc_str, resolver)
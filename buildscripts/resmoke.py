@@ -124,23 +124,20 @@ class Resmoke(object):  # pylint: disable=too-many-instance-attributes
 
         Return a dict keyed by test name, value is array of suite names.
         """
-        memberships = {}
         test_membership = suitesconfig.create_test_membership_map()
-        for suite in suites:
-            for test in suite.tests:
-                memberships[test] = test_membership[test]
-        return memberships
+        return {test: test_membership[test] for suite in suites for test in suite.tests}
 
     def dry_run(self):
         """List which tests would run and which tests would be excluded in a resmoke invocation."""
         suites = self._get_suites()
         for suite in suites:
             self._shuffle_tests(suite)
-            sb = ["Tests that would be run in suite {}".format(suite.get_display_name())]
-            sb.extend(suite.tests or ["(no tests)"])
-            sb.append("Tests that would be excluded from suite {}".format(suite.get_display_name()))
-            sb.extend(suite.excluded or ["(no tests)"])
-            self._exec_logger.info("\n".join(sb))
+            display_name = suite.get_display_name()
+            tests = "\n".join(suite.tests or ["(no tests)"])
+            excluded = "\n".join(suite.excluded or ["(no tests)"])
+            self._exec_logger.info(
+                "Tests that would be run in suite %s\n%s\nTests that would be excluded from suite"
+                " %s\n%s", display_name, tests, display_name, excluded)
 
     def run_tests(self):
         """Run the suite and tests specified."""
@@ -188,7 +185,7 @@ class Resmoke(object):  # pylint: disable=too-many-instance-attributes
 
     def _log_suite_summary(self, suite):
         """Log a summary of the suite run."""
-        self._resmoke_logger.info("=" * 80)
+        self._resmoke_logger.info(testing.suite.SUMMARY_SEPARATOR)
         self._resmoke_logger.info("Summary of %s suite: %s", suite.get_display_name(),
                                   self._get_suite_summary(suite))
 
@@ -238,14 +235,12 @@ class Resmoke(object):  # pylint: disable=too-many-instance-attributes
             self.exit(1)
 
     def _log_suite_config(self, suite):
-        sb = [
-            "YAML configuration of suite {}".format(suite.get_display_name()),
-            utils.dump_yaml({"test_kind": suite.get_test_kind_config()}), "",
-            utils.dump_yaml({"selector": suite.get_selector_config()}), "",
-            utils.dump_yaml({"executor": suite.get_executor_config()}), "",
-            utils.dump_yaml({"logging": self._config.logging_config})
-        ]
-        self._resmoke_logger.info("\n".join(sb))
+        self._resmoke_logger.info("YAML configuration of suite %s\n%s\n\n%s\n\n%s\n\n%s",
+                                  suite.get_display_name(),
+                                  utils.dump_yaml({"test_kind": suite.get_test_kind_config()}),
+                                  utils.dump_yaml({"selector": suite.get_selector_config()}),
+                                  utils.dump_yaml({"executor": suite.get_executor_config()}),
+                                  utils.dump_yaml({"logging": self._config.logging_config}))
 
     @staticmethod
     def _get_suite_summary(suite):
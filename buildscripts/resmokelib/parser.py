@@ -379,14 +379,11 @@ def _update_config_vars(values):  # pylint: disable=too-many-statements
 
     config = _config.DEFAULTS.copy()
 
-    # Override `config` with values from command line arguments.
-    cmdline_vars = vars(values)
-    for cmdline_key in cmdline_vars:
-        if cmdline_key not in _config.DEFAULTS:
-            # Ignore options that don't map to values in config.py
-            continue
-        if cmdline_vars[cmdline_key] is not None:
-            config[cmdline_key] = cmdline_vars[cmdline_key]
+    # Override `config` with values from command line arguments. Options that don't map to values
+    # in config.py are ignored.
+    for cmdline_key, cmdline_value in vars(values).items():
+        if cmdline_value is not None and cmdline_key in config:
+            config[cmdline_key] = cmdline_value
 
     _config.ARCHIVE_FILE = config.pop("archive_file")
     _config.ARCHIVE_LIMIT_MB = config.pop("archive_limit_mb")
@@ -513,9 +510,6 @@ def _tags_from_list(tags_list):
     Each parameter value in the list may be a list of comma separated tags, with empty strings
     ignored.
     """
-    tags = []
-    if tags_list is not None:
-        for tag in tags_list:
-            tags.extend([t for t in tag.split(",") if t != ""])
-        return tags
-    return None
+    if tags_list is None:
+        return None
+    return [tag for tag in ",".join(tags_list).split(",") if tag != ""]
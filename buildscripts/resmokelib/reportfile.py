@@ -19,5 +19,8 @@ def write(suites):
         reports.extend(suite.get_reports())
 
     combined_report_dict = _report.TestReport.combine(*reports).as_dict()
+    # Encode the whole report in one call and write it at once, json.dump() would issue a write for
+    # every fragment of the encoded report.
+    report_json = json.dumps(combined_report_dict, separators=(",", ":"))
     with open(config.REPORT_FILE, "w") as fp:
-        json.dump(combined_report_dict, fp)
+        fp.write(report_json)
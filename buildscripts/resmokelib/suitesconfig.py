@@ -3,6 +3,7 @@
 from __future__ import absolute_import
 
 import collections
+import copy
 import optparse
 import os
 
@@ -23,18 +24,42 @@ def get_named_suites():
     return suite_names
 
 
+# Test membership maps already created in this process, keyed by the arguments used to create them.
+# They are never invalidated, see create_test_membership_map().
+_TEST_MEMBERSHIP_MAPS = {}
+
+
 def create_test_membership_map(fail_on_missing_selector=False, test_kind=None):
     """Return a dict keyed by test name containing all of the suites that will run that test.
 
     If 'test_kind' is specified then only the mappings for that kind are returned.
-    Since this iterates through every available suite, it should only be run once.
+    Since this iterates through every available suite, the map is only created once per process
+    for a given set of arguments and is frozen from then on: later changes to the suite files or
+    to the tag and selector options in resmokelib.config aren't reflected in it. Each call
+    returns a new copy of the map, so callers are free to modify it.
     """
 
+    key = (fail_on_missing_selector, test_kind)
+    if key not in _TEST_MEMBERSHIP_MAPS:
+        _TEST_MEMBERSHIP_MAPS[key] = _create_test_membership_map(fail_on_missing_selector,
+                                                                 test_kind)
+    test_membership = collections.defaultdict(list)
+    for test, suite_names in _TEST_MEMBERSHIP_MAPS[key].items():
+        test_membership[test] = list(suite_names)
+    return test_membership
+
+
+def _create_test_membership_map(fail_on_missing_selector, test_kind):
     test_membership = collections.defaultdict(list)
     suite_names = get_named_suites()
     for suite_name in suite_names:
         try:
-            suite_config = _get_suite_config(suite_name)
+            # Building the map only reads the suite config: Suite.get_selector_config() copies
+            # the selector section before adding tags to it, selector.filter_tests() only reads
+            # it, and _SelectorConfig.__merge_lists() merges the tag lists into new sets. Any
+            # mutation here would silently change the config that later calls read from
+            # _YAML_CONFIGS.
+            suite_config = _get_shared_suite_config(suite_name)
             if test_kind and suite_config.get("test_kind") != test_kind:
                 continue
             suite = _suite.Suite(suite_name, suite_config)
@@ -97,6 +122,16 @@ def _make_suite_roots(files):
 
 def _get_suite_config(pathname):
     """Attempt to read YAML configuration from 'pathname' for the suite."""
+    return copy.deepcopy(_get_shared_suite_config(pathname))
+
+
+def _get_shared_suite_config(pathname):
+    """Read the YAML configuration for the suite without copying it.
+
+    The returned object is the one cached in _YAML_CONFIGS and is shared with later calls, so it
+    must not be modified. Use _get_suite_config() for a config that will be updated or handed to
+    the executor.
+    """
     return _get_yaml_config("suite", pathname)
 
 
@@ -111,4 +146,22 @@ def _get_yaml_config(kind, pathname):
     if not utils.is_yaml_file(pathname) or not os.path.isfile(pathname):
         raise optparse.OptionValueError("Expected a %s YAML config, but got '%s'" % (kind,
                                                                                      pathname))
-    return utils.load_yaml_file(pathname)
+    return _load_yaml_file_cached(pathname)
+
+
+# Parsed YAML configs keyed by absolute path, with the modification time they were read at.
+_YAML_CONFIGS = {}
+
+
+def _load_yaml_file_cached(pathname):
+    """Return the parsed contents of the YAML file 'pathname', reading it only when it changed.
+
+    The returned object is shared with later calls and must not be modified.
+    """
+    pathname = os.path.abspath(pathname)
+    mtime = os.path.getmtime(pathname)
+    cached = _YAML_CONFIGS.get(pathname)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, utils.load_yaml_file(pathname))
+        _YAML_CONFIGS[pathname] = cached
+    return cached[1]
@@ -3,7 +3,6 @@
 from __future__ import absolute_import
 
 import threading
-import time
 
 from . import fixtures
 from . import hook_test_archival as archival
@@ -156,8 +155,9 @@ class TestSuiteExecutor(object):  # pylint: disable=too-many-instance-attributes
         try:
             # Run each Job instance in its own thread.
             for job in self._jobs:
+                ready_flag = threading.Event()
                 thr = threading.Thread(target=job, args=(test_queue, interrupt_flag), kwargs=dict(
-                    setup_flag=setup_flag, teardown_flag=teardown_flag))
+                    setup_flag=setup_flag, teardown_flag=teardown_flag, ready_flag=ready_flag))
                 # Do not wait for tests to finish executing if interrupted by the user.
                 thr.daemon = True
                 thr.start()
@@ -165,8 +165,10 @@ class TestSuiteExecutor(object):  # pylint: disable=too-many-instance-attributes
                 # SERVER-24729 Need to stagger when jobs start to reduce I/O load if there
                 # are many of them.  Both the 5 and the 10 are arbitrary.
                 # Currently only enabled on Evergreen.
+                # The I/O load comes from starting the fixture, so stop waiting as soon as the
+                # job's fixture is set up rather than always waiting the full 10 seconds.
                 if _config.STAGGER_JOBS and len(threads) >= 5:
-                    time.sleep(10)
+                    ready_flag.wait(10)
 
             joined = False
             while not joined:
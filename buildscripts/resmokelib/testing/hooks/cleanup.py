@@ -6,6 +6,9 @@ import os
 
 from . import interface
 
+# The environment does not change while resmoke runs, so only check it once for all jobs.
+_ASAN_DETECT_LEAKS = "detect_leaks=1" in os.getenv("ASAN_OPTIONS", "")
+
 
 class CleanEveryN(interface.Hook):
     """Restart the fixture after it has ran 'n' tests.
@@ -21,7 +24,7 @@ class CleanEveryN(interface.Hook):
         interface.Hook.__init__(self, hook_logger, fixture, description)
 
         # Try to isolate what test triggers the leak by restarting the fixture each time.
-        if "detect_leaks=1" in os.getenv("ASAN_OPTIONS", ""):
+        if _ASAN_DETECT_LEAKS:
             self.logger.info("ASAN_OPTIONS environment variable set to detect leaks, so restarting"
                              " the fixture after each test instead of after every %d.", n)
             n = 1
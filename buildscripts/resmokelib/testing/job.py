@@ -73,7 +73,8 @@ class Job(object):  # pylint: disable=too-many-instance-attributes
         # Drain the queue to unblock the main thread.
         Job._drain_queue(queue)
 
-    def __call__(self, queue, interrupt_flag, setup_flag=None, teardown_flag=None):
+    def __call__(  # pylint: disable=too-many-arguments
+            self, queue, interrupt_flag, setup_flag=None, teardown_flag=None, ready_flag=None):
         """Continuously execute tests from 'queue' and records their details in 'report'.
 
         If 'setup_flag' is not None, then a test to set up the fixture will be run
@@ -82,8 +83,16 @@ class Job(object):  # pylint: disable=too-many-instance-attributes
         If 'teardown_flag' is not None, then a test to tear down the fixture
         will be run before this method returns. If an error occurs
         while destroying the fixture, then the 'teardown_flag' will be set.
+        If 'ready_flag' is not None, then it will be set once the fixture has been set up,
+        whether or not the setup was successful, and before any test is run.
         """
-        if setup_flag is not None and not self.setup_fixture():
+        try:
+            setup_failed = setup_flag is not None and not self.setup_fixture()
+        finally:
+            if ready_flag is not None:
+                ready_flag.set()
+
+        if setup_failed:
             self._interrupt_all_jobs(queue, interrupt_flag)
             return
 
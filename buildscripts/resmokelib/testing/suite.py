@@ -11,6 +11,9 @@ from . import summary as _summary
 from .. import config as _config
 from .. import selector as _selector
 
+# Separator line logged before a summary of suite results.
+SUMMARY_SEPARATOR = "=" * 80
+
 # Map of error codes that could be seen. This is collected from:
 # * dbshell.cpp
 # * exit_code.h
@@ -343,5 +346,5 @@ class Suite(object):  # pylint: disable=too-many-instance-attributes
             suite.summarize(suite_sb)
             sb.append("    %s: %s" % (suite.get_display_name(), "\n    ".join(suite_sb)))
 
-        logger.info("=" * 80)
+        logger.info(SUMMARY_SEPARATOR)
         logger.info("\n".join(sb))
@@ -12,6 +12,15 @@ import yaml
 
 from . import archival
 
+# Use the libyaml based loader and dumper when they are available since they are much faster than
+# the pure Python implementations.
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
 
 @contextlib.contextmanager
 def open_or_use_stdout(filename):
@@ -94,7 +103,7 @@ def load_yaml_file(filename):
     """Attempt to read 'filename' as YAML."""
     try:
         with open(filename, "r") as fp:
-            return yaml.safe_load(fp)
+            return yaml.load(fp, Loader=_YamlLoader)
     except yaml.YAMLError as err:
         raise ValueError("File '%s' contained invalid YAML: %s" % (filename, err))
 
@@ -103,7 +112,7 @@ def dump_yaml_file(value, filename):
     """Attempt to write YAML object to filename."""
     try:
         with open(filename, "w") as fp:
-            return yaml.safe_dump(value, fp)
+            return yaml.dump(value, fp, Dumper=_YamlDumper)
     except yaml.YAMLError as err:
         raise ValueError("Could not write YAML to file '%s': %s" % (filename, err))
 
@@ -111,12 +120,12 @@ def dump_yaml_file(value, filename):
 def dump_yaml(value):
     """Return 'value' formatted as YAML."""
     # Use block (indented) style for formatting YAML.
-    return yaml.safe_dump(value, default_flow_style=False).rstrip()
+    return yaml.dump(value, Dumper=_YamlDumper, default_flow_style=False).rstrip()
 
 
 def load_yaml(value):
     """Attempt to parse 'value' as YAML."""
     try:
-        return yaml.safe_load(value)
+        return yaml.load(value, Loader=_YamlLoader)
     except yaml.YAMLError as err:
         raise ValueError("Attempted to parse invalid YAML value '%s': %s" % (value, err))
@@ -6,6 +6,13 @@ import re
 
 import yaml
 
+# Use the libyaml based loader when it is available since it is much faster than the pure Python
+# loader.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # TODO: use a more robust regular expression for matching tags
 _JSTEST_TAGS_RE = re.compile(r".*@tags\s*:\s*(\[[^\]]*\])", re.DOTALL)
 
@@ -35,7 +42,7 @@ def get_tags(pathname):
             try:
                 # TODO: it might be worth supporting the block (indented) style of YAML lists in
                 #       addition to the flow (bracketed) style
-                tags = yaml.safe_load(_strip_jscomments(match.group(1)))
+                tags = yaml.load(_strip_jscomments(match.group(1)), Loader=_YamlLoader)
                 if not isinstance(tags, list) and all(isinstance(tag, basestring) for tag in tags):
                     raise TypeError("Expected a list of string tags, but got '%s'" % (tags))
                 return tags
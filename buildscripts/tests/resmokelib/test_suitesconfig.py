@@ -0,0 +1,99 @@
+"""Unit tests for the resmokelib.suitesconfig module."""
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from buildscripts.resmokelib import suitesconfig
+from buildscripts.resmokelib import utils
+
+# pylint: disable=missing-docstring,protected-access
+
+
+class TestCreateTestMembershipMap(unittest.TestCase):
+    def setUp(self):
+        suitesconfig._TEST_MEMBERSHIP_MAPS.clear()
+        self.addCleanup(suitesconfig._TEST_MEMBERSHIP_MAPS.clear)
+
+    @mock.patch("buildscripts.resmokelib.suitesconfig._create_test_membership_map")
+    def test_map_is_created_once(self, create_mock):
+        create_mock.return_value = {"jstests/core/all.js": ["core"]}
+
+        first = suitesconfig.create_test_membership_map()
+        second = suitesconfig.create_test_membership_map()
+
+        self.assertEqual(first, second)
+        create_mock.assert_called_once_with(False, None)
+
+    @mock.patch("buildscripts.resmokelib.suitesconfig._create_test_membership_map")
+    def test_missing_test_lookup_is_not_cached(self, create_mock):
+        create_mock.return_value = {"jstests/core/all.js": ["core"]}
+
+        first = suitesconfig.create_test_membership_map()
+        self.assertEqual(first["jstests/core/none.js"], [])
+        second = suitesconfig.create_test_membership_map()
+
+        self.assertEqual(second, {"jstests/core/all.js": ["core"]})
+
+    @mock.patch("buildscripts.resmokelib.suitesconfig._create_test_membership_map")
+    def test_modified_suite_list_is_not_cached(self, create_mock):
+        create_mock.return_value = {"jstests/core/all.js": ["core"]}
+
+        first = suitesconfig.create_test_membership_map()
+        first["jstests/core/all.js"].append("aggregation")
+        second = suitesconfig.create_test_membership_map()
+
+        self.assertEqual(second["jstests/core/all.js"], ["core"])
+
+    @mock.patch("buildscripts.resmokelib.suitesconfig._create_test_membership_map")
+    def test_map_is_created_per_test_kind(self, create_mock):
+        create_mock.side_effect = lambda fail_on_missing_selector, test_kind: {}
+
+        suitesconfig.create_test_membership_map()
+        suitesconfig.create_test_membership_map(test_kind="js_test")
+        suitesconfig.create_test_membership_map(test_kind="js_test")
+
+        self.assertEqual(create_mock.call_count, 2)
+        create_mock.assert_called_with(False, "js_test")
+
+
+class TestGetSuiteConfig(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        suitesconfig._YAML_CONFIGS.clear()
+        self.addCleanup(suitesconfig._YAML_CONFIGS.clear)
+
+        self.suite_file = os.path.join(self.tmpdir, "suite.yml")
+        utils.dump_yaml_file({"test_kind": "js_test", "selector": {"roots": ["a.js"]}},
+                             self.suite_file)
+
+    @mock.patch("buildscripts.resmokelib.utils.load_yaml_file", wraps=utils.load_yaml_file)
+    def test_file_is_read_once(self, load_mock):
+        first = suitesconfig._get_suite_config(self.suite_file)
+        first["selector"]["roots"].append("b.js")
+        second = suitesconfig._get_suite_config(self.suite_file)
+
+        self.assertEqual(second["selector"]["roots"], ["a.js"])
+        self.assertEqual(load_mock.call_count, 1)
+
+    def test_shared_config_is_not_copied(self):
+        first = suitesconfig._get_shared_suite_config(self.suite_file)
+        second = suitesconfig._get_shared_suite_config(self.suite_file)
+
+        self.assertIs(first, second)
+        self.assertIsNot(suitesconfig._get_suite_config(self.suite_file), first)
+
+    def test_file_is_read_again_when_modified(self):
+        suitesconfig._get_suite_config(self.suite_file)
+        utils.dump_yaml_file({"test_kind": "cpp_unit_test"}, self.suite_file)
+        mtime = os.path.getmtime(self.suite_file) + 10
+        os.utime(self.suite_file, (mtime, mtime))
+
+        self.assertEqual(
+            suitesconfig._get_suite_config(self.suite_file), {"test_kind": "cpp_unit_test"})